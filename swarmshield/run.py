@@ -21,8 +21,6 @@ try:
 except ImportError:
     pass
 
-from swarmshield.main import main
-
 
 def parse_args():
     """Parse command-line arguments."""
@@ -156,6 +154,10 @@ if __name__ == "__main__":
     # ─────────────────────────────────────────────────────────────────────────
 
     try:
+        # Imported here, after LIVE_MODE is set and past the MCP branch,
+        # so mcp-server startup skips the crew/agent stack entirely.
+        from swarmshield.main import main
+
         # Run the main function with parsed arguments
         main(
             mode=args.mode,
@@ -8,8 +8,18 @@ __version__ = "0.1.0"
 __author__ = "SwarmShield Team"
 __description__ = "Autonomous network defense using CrewAI agents"
 
-from . import agents
-from . import tools
+import importlib
+from typing import Any
+
+# Subpackages load on first attribute access (PEP 562): entry points such
+# as ``run.py --mode=mcp-server`` only import the modules they use.
+_SUBPACKAGES = ("agents", "tools")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "agents",
@@ -4,31 +4,41 @@ SwarmShield Agents
 Agent implementations for network defense swarm.
 """
 
+import importlib
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 _logger = logging.getLogger(__name__)
 
-try:
-    from .scout import ScoutAgent
-except Exception:
-    ScoutAgent = None  # type: ignore[assignment,misc]
-
-try:
-    from .analyzer import AnalyzerAgent
-except Exception:
-    AnalyzerAgent = None  # type: ignore[assignment,misc]
-
-try:
-    from .responder import app as responder_app
-except Exception:
-    responder_app = None  # type: ignore[assignment]
-
-try:
-    from .evolver import Mahoraga, EvolverAgent
-except Exception:
-    Mahoraga = None      # type: ignore[assignment,misc]
-    EvolverAgent = None  # type: ignore[assignment,misc]
+# Exported name → (submodule, attribute).  Resolved on first access (PEP 562)
+# so importing the package does not pull in Scout's NumPy/LLM stack or the
+# Responder's Flask app until something actually asks for them.  A name
+# whose submodule fails to import resolves to None, as before.
+_LAZY_EXPORTS: Dict[str, tuple] = {
+    "ScoutAgent":    (".scout",     "ScoutAgent"),
+    "AnalyzerAgent": (".analyzer",  "AnalyzerAgent"),
+    "responder_app": (".responder", "app"),
+    "Mahoraga":      (".evolver",   "Mahoraga"),
+    "EvolverAgent":  (".evolver",   "EvolverAgent"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+    except Exception as exc:
+        _logger.debug("agents.%s unavailable: %s", name, exc)
+        value = None
+    globals()[name] = value         # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 
 class ResponderAgent:
@@ -1,15 +1,30 @@
+import functools
 import logging
 import math
-import random
-from collections import defaultdict
+import sys
+from collections import defaultdict, namedtuple
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import compress
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Optional Numba: runs each propagation trial as a compiled BFS, trials
+# spread across cores with prange.
+try:
+    from numba import njit, prange  # type: ignore[import]
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    _NUMBA_AVAILABLE = False
 
 try:
     from .llm_client import LLMClient
 except ImportError:
     LLMClient = None  # type: ignore[assignment,misc]
 
+from ..utils.timefmt import now_iso_seconds
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -20,6 +35,15 @@ N_SIM_TRIALS     = 500   # Monte Carlo trials for propagation simulation
 RISK_HIGH        = 0.70
 RISK_MEDIUM      = 0.40
 
+# Recommendation text per rule, built once at import.
+# Each template takes (ip, confidence, threat_type).
+_REC_TEMPLATES: Dict[str, Callable[[str, float, str], str]] = {
+    "ddos_high":  lambda ip, c, tt: f"Block {ip} immediately (DDoS confidence={c:.0%})",
+    "portscan":   lambda ip, c, tt: f"Redirect {ip} to honeypot (PortScan confidence={c:.0%})",
+    "exfil":      lambda ip, c, tt: f"Quarantine {ip} — data exfiltration detected (confidence={c:.0%})",
+    "elevated":   lambda ip, c, tt: f"Monitor {ip} — elevated risk ({tt}, confidence={c:.0%})",
+}
+
 
 # ===========================================================================
 # LLM prompt engineering (Analyzer)
@@ -119,31 +143,43 @@ def _confidence_to_propagation(confidence: float) -> float:
     return min(1.0, PROPAGATION_BASE + confidence * 0.5)
 
 
+def _intern_str(value: Any) -> Any:
+    """``sys.intern`` for strings; anything else is returned unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
 def _build_nodes(observations: List[Dict]) -> List[Dict]:
     """
     Convert a list of Scout threat observations into graph nodes.
 
     Each node represents a unique source IP with aggregated threat type
     and maximum confidence across all observations from that IP.
+
+    The first pass only tracks the winning (confidence, observation) per
+    IP; node dicts are built once per IP afterwards, not for every
+    observation that takes the lead along the way.  Threat types are
+    interned, so the per-type bucketing in _build_edges and the
+    _threat_rule cache hit on identity.
     """
-    ip_map: Dict[str, Dict] = {}
+    best: Dict[str, Tuple[float, Dict]] = {}
     for obs in observations:
         ip   = obs.get("source_ip", "unknown")
         conf = float(obs.get("confidence", 0.0))
-        att  = obs.get("attack_type", "Unknown")
-        mc   = obs.get("monte_carlo", {})
-
-        if ip not in ip_map or conf > ip_map[ip]["confidence"]:
-            ip_map[ip] = {
-                "ip":          ip,
-                "threat_type": att,
-                "confidence":  conf,
-                "monte_carlo": mc,
-                "agent_id":    obs.get("agent_id", "unknown"),
-                "timestamp":   obs.get("timestamp", ""),
-            }
-
-    return list(ip_map.values())
+        lead = best.get(ip)
+        if lead is None or conf > lead[0]:
+            best[ip] = (conf, obs)
+
+    return [
+        {
+            "ip":          ip,
+            "threat_type": _intern_str(obs.get("attack_type", "Unknown")),
+            "confidence":  conf,
+            "monte_carlo": obs.get("monte_carlo", {}),
+            "agent_id":    obs.get("agent_id", "unknown"),
+            "timestamp":   obs.get("timestamp", ""),
+        }
+        for ip, (conf, obs) in best.items()
+    ]
 
 
 def _build_edges(nodes: List[Dict]) -> List[Dict]:
@@ -152,38 +188,223 @@ def _build_edges(nodes: List[Dict]) -> List[Dict]:
 
     Two nodes are connected if they share the same threat type AND both have
     confidence > 0.50 (suggesting a coordinated campaign).
+
+    Weights are kept as raw floats; rounding happens once at the output
+    boundary (see _round_edge_weights).
+
+    Qualifying nodes are bucketed by threat type first, so only pairs that
+    can form an edge are visited.  Edges come out in the same order as a
+    full pairwise scan over *nodes*.
     """
+    hot = [n for n in nodes if n["confidence"] > 0.50]
+    buckets: Dict[str, List[Dict]] = defaultdict(list)
+    for n in hot:
+        buckets[n["threat_type"]].append(n)
+
     edges = []
-    for i, a in enumerate(nodes):
-        for b in nodes[i + 1:]:
-            if (a["threat_type"] == b["threat_type"]
-                    and a["confidence"] > 0.50
-                    and b["confidence"] > 0.50):
-                weight = round((a["confidence"] + b["confidence"]) / 2, 3)
-                edges.append({
-                    "src":         a["ip"],
-                    "dst":         b["ip"],
-                    "threat_type": a["threat_type"],
-                    "weight":      weight,
-                })
+    emitted: Dict[str, int] = defaultdict(int)   # bucket members already used as src
+    for a in hot:
+        tt    = a["threat_type"]
+        later = emitted[tt] + 1
+        emitted[tt] = later
+        src, conf = a["ip"], a["confidence"]
+        for b in buckets[tt][later:]:
+            edges.append({
+                "src":         src,
+                "dst":         b["ip"],
+                "threat_type": tt,
+                "weight":      (conf + b["confidence"]) / 2,
+            })
+    return edges
+
+
+def _round_edge_weights(edges: List[Dict]) -> List[Dict]:
+    """Round edge weights to 3 dp in place for the outward-facing graph."""
+    for edge in edges:
+        edge["weight"] = round(edge["weight"], 3)
     return edges
 
 
-def _graph_summary(nodes: List[Dict], edges: List[Dict]) -> Dict:
-    """High-level summary stats for the threat graph."""
+# Column (structure-of-arrays) view of a non-empty node list: the dicts are
+# walked once, then summaries, rankings and edge matching are array ops.
+# ``type_names`` is sorted and ``type_codes[i]`` indexes into it.
+_NodeArrays = namedtuple("_NodeArrays", "ips confidence type_codes type_names")
+
+
+def _node_arrays(nodes: List[Dict]) -> _NodeArrays:
+    """Split *nodes* (non-empty) into parallel arrays."""
+    names, codes = np.unique([n["threat_type"] for n in nodes], return_inverse=True)
+    return _NodeArrays(
+        ips        = [n["ip"] for n in nodes],
+        confidence = np.fromiter((n["confidence"] for n in nodes), np.float64, len(nodes)),
+        type_codes = codes.reshape(-1),
+        type_names = names.tolist(),
+    )
+
+
+def _graph_summary(
+    nodes: List[Dict], edges: List[Dict], arrays: Optional[_NodeArrays] = None,
+) -> Dict:
+    """
+    High-level summary stats for the threat graph.
+
+    *arrays* is ``_node_arrays(nodes)`` when the caller already has it.
+    """
     if not nodes:
         return {"node_count": 0, "edge_count": 0, "attack_types": [], "max_confidence": 0.0}
 
-    attack_types = sorted({n["threat_type"] for n in nodes})
-    max_conf     = max(n["confidence"] for n in nodes)
+    if arrays is None:
+        arrays = _node_arrays(nodes)
     return {
         "node_count":    len(nodes),
         "edge_count":    len(edges),
-        "attack_types":  attack_types,
-        "max_confidence": round(max_conf, 4),
+        "attack_types":  arrays.type_names,
+        "max_confidence": round(float(arrays.confidence.max()), 4),
     }
 
 
+def _propagation_csr(
+    edges: List[Dict], ip_index: Dict[str, int], n_ips: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Undirected edge list → CSR adjacency ``(indptr, indices, weights)``.
+
+    Neighbours of node ``u`` are ``indices[indptr[u]:indptr[u + 1]]`` with
+    the matching propagation weights.
+    """
+    src = np.fromiter((ip_index[e["src"]] for e in edges), np.intp, len(edges))
+    dst = np.fromiter((ip_index[e["dst"]] for e in edges), np.intp, len(edges))
+    wgt = np.fromiter((e["weight"] for e in edges), np.float64, len(edges))
+    heads   = np.concatenate([src, dst])
+    tails   = np.concatenate([dst, src])
+    order   = np.argsort(heads, kind="stable")
+    indptr  = np.zeros(n_ips + 1, dtype=np.intp)
+    np.cumsum(np.bincount(heads, minlength=n_ips), out=indptr[1:])
+    return indptr, tails[order], np.concatenate([wgt, wgt])[order]
+
+
+def _propagate_levels(
+    indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+    entry_idx: np.ndarray, max_steps: int,
+    visited: np.ndarray, reached: np.ndarray, steps: np.ndarray,
+    rng: np.random.Generator,
+) -> None:
+    """
+    NumPy propagation: all trials advance together, one BFS level at a
+    time, with the Bernoulli outcomes for every open (trial, edge) pair
+    drawn in one batch.  Fills *visited*, *reached* and *steps* in place.
+    """
+    trials = np.arange(len(entry_idx))
+    visited[trials, entry_idx] = True
+    frontier = visited.copy()
+    reached[:] = 1
+    steps[:]   = 0
+    n_ips = visited.shape[1]
+
+    while True:
+        # A trial takes another level while it has a frontier, something
+        # left to compromise, and has not hit the circuit breaker.
+        active = frontier.any(axis=1) & (reached < n_ips) & (steps <= max_steps)
+        if not active.any():
+            break
+        steps += active
+        frontier[~active] = False
+
+        # Expand every (trial, frontier node) pair into its CSR edge range
+        t, u   = np.nonzero(frontier)
+        deg    = indptr[u + 1] - indptr[u]
+        t      = np.repeat(t, deg)
+        eid    = np.repeat(indptr[u] - np.cumsum(deg) + deg, deg) + np.arange(deg.sum())
+        v      = indices[eid]
+        open_  = ~visited[t, v]
+        t, v   = t[open_], v[open_]
+        prob   = np.minimum(1.0, weights[eid[open_]] + rng.normal(0, 0.05, len(t)))
+        hit    = rng.random(len(t)) < prob
+
+        frontier = np.zeros_like(visited)
+        frontier[t[hit], v[hit]] = True
+        visited |= frontier
+        reached += frontier.sum(axis=1)
+
+    # A trial that stopped because everything was compromised still counts
+    # the final (empty) level, as the full BFS always has.
+    steps += (reached == n_ips) & (steps <= max_steps)
+
+
+def _propagate_trials(
+    indptr, indices, weights, entry_idx, max_steps, visited, reached, steps,
+):
+    """
+    Per-trial propagation loop, compiled with ``numba.njit(parallel=True)``
+    when Numba is installed: each trial is an independent queue-based BFS
+    over the CSR graph, and ``prange`` spreads trials across cores.  Same
+    outputs and statistics as ``_propagate_levels``.
+    """
+    n_trials, n_ips = visited.shape
+    for trial in prange(n_trials):
+        seen     = visited[trial]
+        frontier = np.empty(n_ips, dtype=np.intp)
+        nxt      = np.empty(n_ips, dtype=np.intp)
+        frontier[0] = entry_idx[trial]
+        seen[frontier[0]] = True
+        n_front = 1
+        count   = 1
+        level   = 0
+        while n_front > 0 and count < n_ips:
+            n_next = 0
+            for f in range(n_front):
+                u = frontier[f]
+                for e in range(indptr[u], indptr[u + 1]):
+                    v = indices[e]
+                    if not seen[v]:
+                        p = min(1.0, weights[e] + np.random.normal(0.0, 0.05))
+                        if np.random.random() < p:
+                            seen[v] = True
+                            nxt[n_next] = v
+                            n_next += 1
+            frontier, nxt = nxt, frontier
+            n_front = n_next
+            count  += n_next
+            level  += 1
+            if level > max_steps:   # circuit breaker
+                break
+        if count == n_ips and level <= max_steps:
+            level += 1              # the empty level the full BFS would take
+        reached[trial] = count
+        steps[trial]   = level
+
+
+_propagate_trials_nb: Optional[Callable] = None
+_NUMBA_KERNEL_READY: Optional[bool] = None
+
+
+def _numba_kernel_ready() -> bool:
+    """
+    Whether ``_propagate_trials_nb`` can be used.
+
+    The first call builds the kernel and compiles it (or loads it from
+    Numba's on-disk cache) on a one-node graph with the argument types
+    ``_run_propagation_simulation`` passes.  If that fails, the failure is
+    logged once and propagation stays on the NumPy path.
+    """
+    global _NUMBA_KERNEL_READY, _propagate_trials_nb
+    if _NUMBA_KERNEL_READY is None:
+        _NUMBA_KERNEL_READY = False
+        if _NUMBA_AVAILABLE:
+            try:
+                kernel = njit(parallel=True, cache=True)(_propagate_trials)
+                kernel(
+                    np.zeros(2, dtype=np.intp), np.empty(0, dtype=np.intp), np.empty(0),
+                    np.zeros(1, dtype=np.intp), 1, np.zeros((1, 1), dtype=bool),
+                    np.empty(1, dtype=np.intp), np.empty(1, dtype=np.intp),
+                )
+                _propagate_trials_nb = kernel
+                _NUMBA_KERNEL_READY  = True
+            except Exception as exc:
+                logger.warning("Numba propagation kernel unavailable, using NumPy: %s", exc)
+    return _NUMBA_KERNEL_READY
+
+
 def _run_propagation_simulation(
     nodes: List[Dict],
     edges: List[Dict],
@@ -198,72 +419,135 @@ def _run_propagation_simulation(
        Bernoulli probability.
     3. Record which nodes were reached and the path length.
 
+    ``path_length`` counts BFS levels including the final one that reaches
+    nothing new, so a single-node graph reports 1.  Trials stop expanding
+    once every node is compromised, but that last empty level is still
+    counted so the value matches a full BFS.
+
+    Propagation runs in ``_propagate_trials`` (Numba, parallel over
+    trials) when it compiles, else in the batched NumPy ``_propagate_levels``;
+    either fills an ``(n_trials, n_ips)`` boolean ``visited`` matrix.
+
     Returns a list of per-trial result dicts.
     """
     if not nodes:
         return []
 
-    # Build adjacency list for quick lookup
-    adj: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
-    for edge in edges:
-        adj[edge["src"]].append((edge["dst"], edge["weight"]))
-        adj[edge["dst"]].append((edge["src"], edge["weight"]))
-
     ip_list = [n["ip"] for n in nodes]
     conf_list = [n["confidence"] for n in nodes]
 
-    # Weighted random entry-node selection helper
-    def pick_entry() -> str:
-        total = sum(conf_list) or len(ip_list)
-        r = random.random() * total
-        acc = 0.0
-        for ip, w in zip(ip_list, conf_list):
-            acc += w
-            if r <= acc:
-                return ip
-        return ip_list[-1]
-
-    results = []
-    rng = random.Random()
-
-    for trial in range(n_trials):
-        entry  = pick_entry()
-        visited = {entry}
-        frontier = [entry]
-        steps = 0
-
-        while frontier:
-            next_frontier = []
-            for node in frontier:
-                for (neighbour, weight) in adj.get(node, []):
-                    if neighbour not in visited:
-                        prop_prob = min(1.0, weight + rng.gauss(0, 0.05))
-                        if rng.random() < prop_prob:
-                            visited.add(neighbour)
-                            next_frontier.append(neighbour)
-            frontier = next_frontier
-            steps += 1
-            if steps > len(nodes):   # circuit breaker
-                break
+    # Every IP the simulation can touch, sorted once so that per-trial
+    # compromised_ips lists come straight out of the visited matrix.
+    sorted_ips = sorted(
+        set(ip_list)
+        | {e["src"] for e in edges}
+        | {e["dst"] for e in edges}
+    )
+    ip_index = {ip: i for i, ip in enumerate(sorted_ips)}
+    n_ips = len(sorted_ips)
+    indptr, indices, weights = _propagation_csr(edges, ip_index, n_ips)
+    rng = np.random.default_rng()
+
+    # Weighted entry-node selection: first node whose running confidence
+    # total reaches r (the last node when every confidence is zero).
+    cdf   = np.cumsum(conf_list)
+    total = cdf[-1] or len(ip_list)
+    picks = np.minimum(
+        np.searchsorted(cdf, rng.random(n_trials) * total), len(ip_list) - 1,
+    )
+    entry_idx = np.array([ip_index[ip] for ip in ip_list])[picks]
+
+    visited = np.zeros((n_trials, n_ips), dtype=bool)
+    reached = np.empty(n_trials, dtype=np.intp)
+    steps   = np.empty(n_trials, dtype=np.intp)
+    if _numba_kernel_ready():
+        _propagate_trials_nb(indptr, indices, weights, entry_idx, len(nodes),
+                             visited, reached, steps)
+    else:
+        _propagate_levels(indptr, indices, weights, entry_idx, len(nodes),
+                          visited, reached, steps, rng)
 
-        results.append({
+    entries = [sorted_ips[i] for i in entry_idx.tolist()]
+    return [
+        {
             "trial":           trial + 1,
             "entry_node":      entry,
-            "nodes_reached":   len(visited),
-            "path_length":     steps,
-            "compromised_ips": sorted(visited),
-        })
+            "nodes_reached":   n_reached,
+            "path_length":     n_steps,
+            "compromised_ips": (
+                list(sorted_ips) if n_reached == n_ips
+                else list(compress(sorted_ips, row))
+            ),
+        }
+        for trial, (entry, n_reached, n_steps, row) in enumerate(zip(
+            entries, reached.tolist(), steps.tolist(), visited.tolist(),
+        ))
+    ]
+
 
-    return results
+# Per-call summary of the node list, computed once in assess_risk() and shared
+# by _aggregate_risk() and _llm_enrich_risk() so neither re-walks the nodes.
+_NodeStats = namedtuple("_NodeStats", "max_conf attack_types sorted_by_conf")
+
+
+def _node_stats(nodes: List[Dict], top_k: Optional[int] = None) -> _NodeStats:
+    """
+    Max confidence, sorted attack types and confidence-desc node order.
+
+    With *top_k* set, ``sorted_by_conf`` holds only the ``top_k`` most
+    confident nodes: ``argpartition`` finds the k-th confidence in O(n) and
+    only nodes at or above it are sorted.  Ties keep input order, as a
+    stable descending sort.
+    """
+    if not nodes:
+        return _NodeStats(0.0, [], [])
+    arrays = _node_arrays(nodes)
+    conf   = arrays.confidence
+    if top_k is not None and 0 < top_k < len(nodes):
+        kth   = conf[np.argpartition(-conf, top_k - 1)[top_k - 1]]
+        cands = np.flatnonzero(conf >= kth)
+        order = cands[np.argsort(-conf[cands], kind="stable")][:top_k]
+    else:
+        order = np.argsort(-conf, kind="stable")[:top_k]
+    sorted_by_conf = [nodes[i] for i in order.tolist()]
+    return _NodeStats(
+        max_conf       = sorted_by_conf[0]["confidence"],
+        attack_types   = arrays.type_names,
+        sorted_by_conf = sorted_by_conf,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _threat_rule(threat_type: str) -> Tuple[bool, Optional[str]]:
+    """
+    Classify a threat type for the recommendation rules, once per distinct
+    string: whether it names a DDoS (which needs confidence >= 0.70 to
+    take "ddos_high"), and the confidence-independent rule ("portscan" /
+    "exfil") that applies otherwise, if any.
+    """
+    tt = threat_type.lower()
+    if "portscan" in tt or "port_scan" in tt:
+        rule = "portscan"
+    elif "exfil" in tt:
+        rule = "exfil"
+    else:
+        rule = None
+    return "ddos" in tt, rule
 
 
 def _aggregate_risk(
     nodes: List[Dict],
     sim_results: List[Dict],
+    node_stats: Optional[_NodeStats] = None,
+    timestamp:  Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Aggregate Monte Carlo results into a risk-assessment report.
 
+    *node_stats* is the precomputed ``_node_stats(nodes)``; it is derived
+    here when the caller does not supply it.  *timestamp* lets a caller
+    assessing several graphs at once stamp them all with one string.
+
     Returns
     -------
     dict with keys:
@@ -275,6 +559,8 @@ def _aggregate_risk(
         recommendations : list of str
         timestamp       : ISO-8601 string
     """
+    if timestamp is None:
+        timestamp = now_iso_seconds()
     if not nodes:
         return {
             "risk_level":      "none",
@@ -283,9 +569,11 @@ def _aggregate_risk(
             "max_spread":      0.0,
             "top_threats":     [],
             "recommendations": ["No threat observations to analyze."],
-            "timestamp":       datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "timestamp":       timestamp,
         }
 
+    if node_stats is None:
+        node_stats = _node_stats(nodes)
     total_nodes = max(len(nodes), 1)
 
     # Spread metrics from simulation
@@ -298,9 +586,8 @@ def _aggregate_risk(
         max_spread = 0.0
 
     # Risk score = weighted average of (confidence × propagation factor)
-    max_conf = max(n["confidence"] for n in nodes)
     risk_score = round(
-        min(1.0, max_conf * 0.6 + avg_spread * 0.4), 4
+        min(1.0, node_stats.max_conf * 0.6 + avg_spread * 0.4), 4
     )
 
     risk_level = (
@@ -311,27 +598,23 @@ def _aggregate_risk(
     )
 
     # Top threats sorted by confidence
-    top_threats = sorted(
-        [{"ip": n["ip"], "threat_type": n["threat_type"], "confidence": n["confidence"]}
-         for n in nodes],
-        key=lambda x: x["confidence"],
-        reverse=True,
-    )
+    top_threats = [
+        {"ip": n["ip"], "threat_type": n["threat_type"], "confidence": n["confidence"]}
+        for n in node_stats.sorted_by_conf
+    ]
 
     # Recommendations
     recs = []
     for threat in top_threats:
-        tt = threat["threat_type"].lower()
-        ip = threat["ip"]
-        c  = threat["confidence"]
-        if "ddos" in tt and c >= 0.70:
-            recs.append(f"Block {ip} immediately (DDoS confidence={c:.0%})")
-        elif "portscan" in tt or "port_scan" in tt:
-            recs.append(f"Redirect {ip} to honeypot (PortScan confidence={c:.0%})")
-        elif "exfil" in tt:
-            recs.append(f"Quarantine {ip} — data exfiltration detected (confidence={c:.0%})")
-        elif c >= 0.50:
-            recs.append(f"Monitor {ip} — elevated risk ({threat['threat_type']}, confidence={c:.0%})")
+        c = threat["confidence"]
+        is_ddos, rule = _threat_rule(threat["threat_type"])
+        if is_ddos and c >= 0.70:
+            rule = "ddos_high"
+        elif rule is None:
+            if c < 0.50:
+                continue
+            rule = "elevated"
+        recs.append(_REC_TEMPLATES[rule](threat["ip"], c, threat["threat_type"]))
     if not recs:
         recs.append("No immediate action required.")
 
@@ -342,7 +625,7 @@ def _aggregate_risk(
         "max_spread":      round(max_spread, 4),
         "top_threats":     top_threats,
         "recommendations": recs,
-        "timestamp":       datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "timestamp":       timestamp,
     }
 
 
@@ -352,6 +635,7 @@ def _llm_enrich_risk(
     assessment:  dict,
     agent_name:  str,
     llm_client,          # Optional[LLMClient]
+    node_stats:  Optional[_NodeStats] = None,
 ) -> Optional[dict]:
     """
     Call the LLM to enrich a risk assessment with threat correlation intelligence.
@@ -359,13 +643,13 @@ def _llm_enrich_risk(
     """
     if llm_client is None or not llm_client.available:
         return None
-    attack_types = sorted({n["threat_type"] for n in nodes})
-    max_conf     = max((n["confidence"] for n in nodes), default=0.0)
+    if node_stats is None:
+        node_stats = _node_stats(nodes)
     graph_summary = {
         "node_count":     len(nodes),
         "edge_count":     0,   # not in scope at assess_risk call site
-        "attack_types":   attack_types,
-        "max_confidence": round(max_conf, 4),
+        "attack_types":   node_stats.attack_types,
+        "max_confidence": round(node_stats.max_conf, 4),
     }
     top_threats = assessment.get("top_threats", [])
     user_msg = _build_analyzer_user_message(
@@ -389,10 +673,16 @@ class AnalyzerAgent:
     - Produce actionable recommendations for the Responder
     """
 
-    def __init__(self, name: str = "Analyzer", llm_client=None):
+    def __init__(self, name: str = "Analyzer", llm_client=None,
+                 top_k: Optional[int] = None):
         self.name        = name
         self.logger      = logging.getLogger(f"{__name__}.{name}")
         self._llm_client = llm_client   # Optional LLM enrichment layer
+        # Cap top_threats / recommendations to the K most confident nodes.
+        # None keeps every node — the Responder tool acts on each listed IP.
+        if top_k is not None and top_k < 1:
+            raise ValueError(f"top_k must be None or >= 1, got {top_k!r}")
+        self.top_k       = top_k
 
     def model_threat_graph(self, observations: List[Dict]) -> Dict[str, Any]:
         """
@@ -416,8 +706,10 @@ class AnalyzerAgent:
         """
         self.logger.info("Building threat graph from %d observation(s)…", len(observations))
         nodes   = _build_nodes(observations)
+        arrays  = _node_arrays(nodes) if nodes else None
         edges   = _build_edges(nodes)
-        summary = _graph_summary(nodes, edges)
+        summary = _graph_summary(nodes, edges, arrays)
+        _round_edge_weights(edges)
         self.logger.info(
             "Graph: %d node(s), %d edge(s), max_conf=%.2f",
             summary["node_count"], summary["edge_count"], summary["max_confidence"],
@@ -487,13 +779,14 @@ class AnalyzerAgent:
         self.logger.info(
             "Assessing risk from %d trial(s), %d node(s)…", len(sims), len(nodes)
         )
-        assessment = _aggregate_risk(nodes, sims)
+        node_stats = _node_stats(nodes, self.top_k)
+        assessment = _aggregate_risk(nodes, sims, node_stats)
         self.logger.info(
             "Risk assessment: level=%s, score=%.4f",
             assessment["risk_level"], assessment["risk_score"],
         )
         llm_insight = _llm_enrich_risk(
-            nodes, sims, assessment, self.name, self._llm_client,
+            nodes, sims, assessment, self.name, self._llm_client, node_stats,
         )
         if llm_insight:
             assessment["llm_insight"] = llm_insight
@@ -695,10 +988,13 @@ class AnalyzerAgent:
             "Infiltration":                 "quarantine",
         }
 
+        # One batched model call for every IP in the window
+        predictions = clf.predict_batch(
+            [ip_data.get("stats", {}) for ip_data in per_ip.values()]
+        )
+
         flagged: List[Dict[str, Any]] = []
-        for source_ip, ip_data in per_ip.items():
-            stats = ip_data.get("stats", {})
-            label, conf, is_attack = clf.predict(stats)
+        for source_ip, (label, conf, is_attack) in zip(per_ip, predictions):
             if is_attack:
                 action = _CIC_ACTION.get(label, "block")
                 self.logger.info(
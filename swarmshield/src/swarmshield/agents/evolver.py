@@ -43,9 +43,14 @@ threat.  Score is in [0, 1]; higher is better.
 import json
 import logging
 import os
-import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from functools import partial
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 try:
     from deap import algorithms, base, creator, tools as deap_tools
@@ -53,6 +58,22 @@ try:
 except ImportError:
     _DEAP_AVAILABLE = False
 
+# Optional Numba: scores a whole population per generation in one
+# compiled, multi-threaded kernel (built on first use, see _numba_kernel_ready).
+try:
+    from numba import njit, prange  # type: ignore[import]
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    _NUMBA_AVAILABLE = False
+
+# Scout does not import this module, so the module-level import is safe.
+from .scout import (
+    _MC_METRICS,
+    N_SIMULATIONS,
+    _monte_carlo_confidences,
+)
+
 try:
     from .llm_client import LLMClient
 except Exception:
@@ -81,6 +102,10 @@ GENE_BOUNDS: List[Tuple[float, float]] = [
     (0.30,      0.90),
 ]
 
+# GENE_BOUNDS as arrays, for drawing whole populations at once
+_GENE_LO = np.array([lo for lo, _ in GENE_BOUNDS])
+_GENE_HI = np.array([hi for _, hi in GENE_BOUNDS])
+
 DEFAULT_GENOME: List[float] = [500.0, 300.0, 20.0, 3.5, 500_000.0, 0.60]
 
 MUT_SIGMA: List[float] = [80.0, 40.0, 4.0, 0.25, 40_000.0, 0.04]
@@ -93,6 +118,19 @@ MUTPB         = 0.30
 INDPB         = 0.30
 TOURNAMENT_K  = 3
 
+# Worker processes for fitness scoring (1 = score in-process).  Only the
+# NumPy scorer uses them: the Numba kernel already spreads a generation
+# across cores with prange.
+def _eval_workers() -> int:
+    raw = (os.environ.get("MAHORAGA_EVAL_WORKERS") or "").strip()
+    try:
+        return max(1, int(raw)) if raw else 1
+    except ValueError:
+        return 1
+
+
+EVAL_WORKERS  = _eval_workers()
+
 # Storage
 _HERE        = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.abspath(os.path.join(_HERE, "..", "..", "..", ".."))
@@ -223,15 +261,23 @@ def _genome_to_thresholds(genome: List[float]) -> Dict[str, float]:
     return {name: float(genome[i]) for i, name in enumerate(GENE_NAMES[:-1])}
 
 
-def _confidence_from_genome(genome: List[float]) -> float:
-    return float(genome[len(GENE_NAMES) - 1])
-
-
 def _clamp_genome(genome: List[float]) -> None:
     for i, (lo, hi) in enumerate(GENE_BOUNDS):
         genome[i] = max(lo, min(hi, genome[i]))
 
 
+def _random_genomes(
+    n: int, rng: Optional[np.random.Generator] = None,
+) -> List[List[float]]:
+    """*n* genomes drawn uniformly within GENE_BOUNDS, in one NumPy call."""
+    rng = rng or np.random.default_rng()
+    return rng.uniform(_GENE_LO, _GENE_HI, (n, len(GENE_NAMES))).tolist()
+
+
+def _confidence_from_genome(genome: List[float]) -> float:
+    return float(genome[len(GENE_NAMES) - 1])
+
+
 def _evaluate_genome(
     genome:   List[float],
     outcomes: List[Dict[str, Any]],
@@ -239,31 +285,216 @@ def _evaluate_genome(
     """
     DEAP fitness function.
     fitness = (TP + TN) / (TP + TN + 2·FP + FN + ε)
+
+    Outcomes are compiled to arrays and scored as a one-member population,
+    so every stats-bearing outcome is tested in the same vectorised pass.
     """
-    from .scout import ScoutAgent   # local import — avoids circular dep at module load
+    metrics, labels = _compile_outcomes(outcomes)
+    return _score_population([genome], metrics, labels)[0]
 
-    thresholds = _genome_to_thresholds(genome)
-    conf_gate  = _confidence_from_genome(genome)
-    tp = fn = tn = fp = 0
 
-    for o in outcomes:
-        stats = o.get("stats")
-        if not stats:
-            continue
-        mc       = ScoutAgent.monte_carlo_estimate(stats, thresholds=thresholds)
-        detected = (mc["top_confidence"] > conf_gate) and (mc["top_threat"] != "normal")
-        was_real = bool(o.get("was_threat", False))
+# ---------------------------------------------------------------------------
+# Batched population scoring
+# ---------------------------------------------------------------------------
 
-        if was_real and detected:
-            tp += 1
-        elif was_real and not detected:
-            fn += 1
-        elif not was_real and not detected:
-            tn += 1
-        else:
-            fp += 1
+# Cap on (individual, outcome, simulation) cells per NumPy scoring chunk
+_SCORE_CHUNK_CELLS = 1 << 20
 
-    return ((tp + tn) / (tp + tn + 2 * fp + fn + 1e-9),)
+
+def _compile_outcomes(outcomes: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Outcome records → ``(metrics, labels)`` arrays for population scoring.
+
+    ``metrics`` is ``(M, 5)`` in Scout's ``_MC_METRICS`` order (the order of
+    the threshold genes); ``labels`` holds ``was_threat``.  Records without
+    stats are dropped, as ``_evaluate_genome`` skips them.
+    """
+    rows    = [o for o in outcomes if o.get("stats")]
+    metrics = np.array(
+        [[float(o["stats"].get(k, 0.0)) for k in _MC_METRICS] for o in rows],
+        dtype=np.float64,
+    ).reshape(-1, len(_MC_METRICS))
+    labels  = np.array([bool(o.get("was_threat", False)) for o in rows], dtype=bool)
+    return metrics, labels
+
+
+def _score_population_arrays(
+    genomes: np.ndarray, metrics: np.ndarray, labels: np.ndarray,
+    n_simulations: int = N_SIMULATIONS,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    ``_evaluate_genome`` fitness for every row of *genomes* ``(P, 6)`` at
+    once, using Scout's array Monte Carlo rules.  Outcomes are processed in
+    chunks of at most ``_SCORE_CHUNK_CELLS`` simulated cells.
+    """
+    if len(genomes) == 0:
+        # eaSimple maps the evaluator over an empty list when no offspring
+        # changed in a generation
+        return np.empty(0)
+    rng   = rng or np.random.default_rng()
+    gates = genomes[:, 5:6]
+    tp, tn, fp, fn = np.zeros((4, len(genomes)))
+    step  = max(1, _SCORE_CHUNK_CELLS // (len(genomes) * n_simulations))
+    for lo in range(0, len(metrics), step):
+        conf = _monte_carlo_confidences(
+            metrics[None, lo:lo + step], genomes[:, None, :5], n_simulations, rng,
+        )
+        top      = conf.max(axis=-1)
+        # Below 0.10 Scout reports "normal", which never counts as detected
+        detected = (top >= 0.10) & (top > gates)
+        real     = labels[lo:lo + step]
+        tp += (detected & real).sum(axis=1)
+        tn += (~detected & ~real).sum(axis=1)
+        fp += (detected & ~real).sum(axis=1)
+        fn += (~detected & real).sum(axis=1)
+    return (tp + tn) / (tp + tn + 2 * fp + fn + 1e-9)
+
+
+def _score_population_loop(genomes, metrics, labels, n_simulations, out):
+    """
+    Loop form of ``_score_population_arrays`` for ``numba.njit``: one
+    population member per ``prange`` iteration with the noise drawn inline,
+    so nothing of size ``P x M x n_simulations`` is ever allocated.
+    Writes each member's fitness into *out*.
+    """
+    for p in prange(genomes.shape[0]):
+        g0   = genomes[p, 0]
+        g1   = genomes[p, 1]
+        g2   = genomes[p, 2]
+        g3   = genomes[p, 3]
+        g4   = genomes[p, 4]
+        gate = genomes[p, 5]
+        tp = tn = fp = fn = 0
+        for m in range(metrics.shape[0]):
+            v0 = metrics[m, 0]
+            v1 = metrics[m, 1]
+            v2 = metrics[m, 2]
+            v3 = metrics[m, 3]
+            v4 = metrics[m, 4]
+            ddos = scan = exfil = 0
+            for _ in range(n_simulations):
+                h0 = max(0.0, v0 + v0 * np.random.normal(0.0, 0.10)) >= g0
+                h1 = max(0.0, v1 + v1 * np.random.normal(0.0, 0.10)) >= g1
+                h2 = max(0.0, v2 + v2 * np.random.normal(0.0, 0.10)) >= g2
+                h3 = max(0.0, v3 + v3 * np.random.normal(0.0, 0.10)) >= g3
+                h4 = max(0.0, v4 + v4 * np.random.normal(0.0, 0.10)) >= g4
+                if h0 or h1:
+                    ddos += 1
+                if h2 or h3:
+                    scan += 1
+                if h4:
+                    exfil += 1
+            top      = max(ddos, scan, exfil) / n_simulations
+            detected = top >= 0.10 and top > gate
+            if labels[m]:
+                if detected:
+                    tp += 1
+                else:
+                    fn += 1
+            elif detected:
+                fp += 1
+            else:
+                tn += 1
+        out[p] = (tp + tn) / (tp + tn + 2 * fp + fn + 1e-9)
+
+
+if _NUMBA_AVAILABLE:
+    _score_population_nb = njit(parallel=True, cache=True, fastmath=True)(
+        _score_population_loop
+    )
+
+# None until the compiled kernel has been tried, then whether it works
+_NUMBA_KERNEL_READY: Optional[bool] = None
+
+
+def _numba_kernel_ready() -> bool:
+    """
+    Whether ``_score_population_nb`` can be used.
+
+    The first call compiles the kernel (or loads it from Numba's on-disk
+    cache) with the argument types ``_score_population`` passes.  If that
+    fails, the failure is logged once and scoring stays on the NumPy path.
+    """
+    global _NUMBA_KERNEL_READY
+    if _NUMBA_KERNEL_READY is None:
+        _NUMBA_KERNEL_READY = False
+        if _NUMBA_AVAILABLE:
+            try:
+                _score_population_nb(
+                    np.zeros((1, len(GENE_NAMES))), np.zeros((1, len(_MC_METRICS))),
+                    np.zeros(1, dtype=bool), 1, np.empty(1),
+                )
+                _NUMBA_KERNEL_READY = True
+            except Exception as exc:
+                logger.warning("Numba fitness kernel unavailable, using NumPy: %s", exc)
+    return _NUMBA_KERNEL_READY
+
+
+def _score_population(
+    population: Sequence[Sequence[float]], metrics: np.ndarray, labels: np.ndarray,
+) -> List[Tuple[float]]:
+    """DEAP-style ``(fitness,)`` tuples for *population* against compiled outcomes."""
+    genomes = np.asarray(population, dtype=np.float64).reshape(-1, len(GENE_NAMES))
+    if _numba_kernel_ready():
+        fitness = np.empty(len(genomes))
+        _score_population_nb(genomes, metrics, labels, N_SIMULATIONS, fitness)
+    else:
+        fitness = _score_population_arrays(genomes, metrics, labels)
+    return [(f,) for f in fitness.tolist()]
+
+
+class _OutcomeScorer:
+    """
+    DEAP ``evaluate`` callable bound to one outcome set.
+
+    Outcomes are compiled to arrays once per ``evolve()``.  ``score()``
+    evaluates a whole batch of individuals in one call; ``_batch_map``
+    (the toolbox ``map``) routes each generation's evaluations through it.
+
+    With *pool* (an executor with *workers* processes) set, each batch is
+    split into one chunk per worker and the chunks are scored in parallel.
+    """
+
+    def __init__(
+        self,
+        outcomes: List[Dict[str, Any]],
+        pool:     Optional[Executor] = None,
+        workers:  int = 1,
+    ) -> None:
+        self.metrics, self.labels = _compile_outcomes(outcomes)
+        self.pool    = pool
+        self.workers = workers
+
+    def __call__(self, genome: Sequence[float]) -> Tuple[float]:
+        return self.score([genome])[0]
+
+    def score(self, population: Sequence[Sequence[float]]) -> List[Tuple[float]]:
+        if self.pool is None or len(population) < 2:
+            return _score_population(population, self.metrics, self.labels)
+        chunks = np.array_split(
+            np.asarray(population, dtype=np.float64), min(self.workers, len(population)),
+        )
+        results = self.pool.map(
+            _score_population, chunks, repeat(self.metrics), repeat(self.labels),
+        )
+        return [fit for part in results for fit in part]
+
+
+def _batch_map(func: Callable, iterable) -> Any:
+    """
+    ``toolbox.map``: one batched ``score()`` call for evaluators that offer
+    it, the builtin ``map`` for everything else.
+
+    ``Toolbox.register`` wraps the evaluator in a ``functools.partial``, so
+    an argument-free partial is unwrapped before looking for ``score``.
+    """
+    if isinstance(func, partial) and not func.args and not func.keywords:
+        func = func.func
+    score = getattr(func, "score", None)
+    if score is None:
+        return map(func, iterable)
+    return score(list(iterable))
 
 
 # ===========================================================================
@@ -281,9 +512,7 @@ def _setup_deap() -> Optional[Any]:
     tb = base.Toolbox()
 
     def _rand_ind():
-        return creator.MaharagaIndividual(
-            random.uniform(lo, hi) for lo, hi in GENE_BOUNDS
-        )
+        return creator.MaharagaIndividual(_random_genomes(1)[0])
 
     tb.register("individual", deap_tools.initIterate, creator.MaharagaIndividual, _rand_ind)
     tb.register("population", deap_tools.initRepeat,  list, tb.individual)
@@ -291,6 +520,7 @@ def _setup_deap() -> Optional[Any]:
     tb.register("mutate", deap_tools.mutGaussian,
                 mu=[0] * len(GENE_NAMES), sigma=MUT_SIGMA, indpb=INDPB)
     tb.register("select", deap_tools.selTournament, tournsize=TOURNAMENT_K)
+    tb.register("map",    _batch_map)
     return tb
 
 
@@ -330,15 +560,24 @@ class Mahoraga:
         pop_size:         int = POP_SIZE,
         n_generations:    int = N_GENERATIONS,
         llm_client:       Optional["LLMClient"] = None,
+        eval_workers:     int = EVAL_WORKERS,
+        rng:              Optional[np.random.Generator] = None,
     ) -> None:
         self.outcomes_file    = outcomes_file
         self.best_genome_file = best_genome_file
         self.pop_size         = pop_size
         self.n_generations    = n_generations
+        self.eval_workers     = max(1, int(eval_workers))
+        # Draws initial populations; pass a seeded Generator for repeatable runs
+        self._rng             = rng or np.random.default_rng()
         self._llm_client      = llm_client
+        self._outcomes_cache: Optional[tuple] = None
         self.logger           = logging.getLogger(f"{__name__}.Mahoraga")
         self._toolbox         = _TOOLBOX
 
+        # Pay any fitness-kernel JIT cost here rather than in the first evolve()
+        _numba_kernel_ready()
+
         if not _DEAP_AVAILABLE:
             self.logger.warning(
                 "DEAP not installed — evolution disabled. "
@@ -425,7 +664,19 @@ class Mahoraga:
             outcomes = self.load_outcomes()
         if not outcomes:
             outcomes = list(_SYNTHETIC_SCENARIOS)
-        return _evaluate_genome(genome, outcomes)[0]
+        metrics, labels = self._compiled_outcomes(outcomes)
+        return _score_population([genome], metrics, labels)[0][0]
+
+    def _compiled_outcomes(
+        self, outcomes: List[Dict[str, Any]],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """``_compile_outcomes`` result, reused while the same list is passed unchanged in length."""
+        cached = self._outcomes_cache
+        if cached is not None and cached[0] is outcomes and cached[1] == len(outcomes):
+            return cached[2]
+        compiled = _compile_outcomes(outcomes)
+        self._outcomes_cache = (outcomes, len(outcomes), compiled)
+        return compiled
 
     # ------------------------------------------------------------------
     # Population helpers
@@ -440,19 +691,13 @@ class Mahoraga:
         Create an initial DEAP population.
         Individual[0] is seeded from DEFAULT_GENOME when ``seed_defaults=True``.
         """
-        n = size or self.pop_size
+        n    = size or self.pop_size
+        rows = _random_genomes(n, self._rng)
+        if seed_defaults and rows:
+            rows[0] = list(DEFAULT_GENOME)
         if not _DEAP_AVAILABLE or self._toolbox is None:
-            pop = []
-            for i in range(n):
-                g = list(DEFAULT_GENOME) if (i == 0 and seed_defaults) \
-                    else [random.uniform(lo, hi) for lo, hi in GENE_BOUNDS]
-                pop.append(g)
-            return pop
-        pop = self._toolbox.population(n=n)
-        if seed_defaults and pop:
-            for i, val in enumerate(DEFAULT_GENOME):
-                pop[0][i] = val
-        return pop
+            return rows
+        return [creator.MaharagaIndividual(row) for row in rows]
 
     # ------------------------------------------------------------------
     # Core: run the genetic algorithm
@@ -499,25 +744,30 @@ class Mahoraga:
         if prev:
             prev_fitness = prev.get("best_fitness")
 
-        self._toolbox.register("evaluate", _evaluate_genome, outcomes=outcomes)
-
-        population = self.create_population(size=self.pop_size, seed_defaults=True)
-        for ind, fit in zip(population, map(self._toolbox.evaluate, population)):
-            ind.fitness.values = fit
-
         stats_tracker = deap_tools.Statistics(lambda ind: ind.fitness.values[0])
         stats_tracker.register("avg",  lambda x: round(sum(x) / len(x), 4))
         stats_tracker.register("best", max)
         hof = deap_tools.HallOfFame(1)
 
-        _, logbook = algorithms.eaSimple(
-            population, self._toolbox,
-            cxpb=CXPB, mutpb=MUTPB,
-            ngen=self.n_generations,
-            stats=stats_tracker,
-            halloffame=hof,
-            verbose=verbose,
-        )
+        # Score in worker processes only when asked to and when the NumPy
+        # scorer is in use; the pool lives for this one run.
+        parallel = self.eval_workers > 1 and not _numba_kernel_ready()
+        with (ProcessPoolExecutor(self.eval_workers) if parallel else nullcontext()) as pool:
+            self._toolbox.register(
+                "evaluate", _OutcomeScorer(outcomes, pool, self.eval_workers),
+            )
+            population = self.create_population(size=self.pop_size, seed_defaults=True)
+            for ind, fit in zip(population, self._toolbox.map(self._toolbox.evaluate, population)):
+                ind.fitness.values = fit
+
+            _, logbook = algorithms.eaSimple(
+                population, self._toolbox,
+                cxpb=CXPB, mutpb=MUTPB,
+                ngen=self.n_generations,
+                stats=stats_tracker,
+                halloffame=hof,
+                verbose=verbose,
+            )
 
         if verbose:
             for rec in logbook:
@@ -50,7 +50,8 @@ After it captures an attacker session, it makes ONE HTTP POST:
 Endpoints
 ---------
 POST /honeypot_event   Receive one attacker observation (described above)
-GET  /honeypot_events  List recent events (last N, default 50)
+GET  /honeypot_events  List recent events (last N, default 50;
+                       ?format=columns for a column-oriented summary)
 GET  /honeypot_health  Liveness probe
 
 Running standalone (for testing the bridge alone)
@@ -58,19 +59,57 @@ Running standalone (for testing the bridge alone)
     PYTHONPATH=src python -m swarmshield.agents.honeypot_bridge
 
 In normal use the bridge is started by live_demo.py automatically.
+
+Set ``HONEYPOT_BRIDGE_ASYNC=true`` to serve the same endpoints from an
+aiohttp/asyncio server (on uvloop when installed) instead of Flask.
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import threading
+import time
 from collections import deque
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-
-from flask import Flask, jsonify, request
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask import Flask, request
+
+from ..utils.timefmt import iso_from_ns as _iso_from_ns
+
+# Optional fast JSON for request/response bodies and the JSONL log — falls
+# back to the stdlib when orjson is not installed.
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+# Optional asyncio front-end (see run_bridge / HONEYPOT_BRIDGE_ASYNC)
+try:
+    from aiohttp import web as aiohttp_web
+    _AIOHTTP_AVAILABLE = True
+except ImportError:
+    _AIOHTTP_AVAILABLE = False
+
+try:
+    import uvloop
+    _UVLOOP_AVAILABLE = True
+except ImportError:
+    _UVLOOP_AVAILABLE = False
+
+# Optional io_uring backend for the batched JSONL append (Linux only)
+try:
+    import liburing
+    _LIBURING_AVAILABLE = True
+except ImportError:
+    _LIBURING_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +123,20 @@ BRIDGE_AGENT_ID = os.environ.get("HONEYPOT_BRIDGE_ID",   "honeypot-bridge-1")
 # Keep the last N events in memory for the /honeypot_events endpoint
 _MEMORY_BUFFER_SIZE = int(os.environ.get("HONEYPOT_MEMORY_EVENTS", "500"))
 
+# Max events waiting for the Mahoraga recorder before new ones are dropped
+_MAHORAGA_QUEUE_SIZE = int(os.environ.get("HONEYPOT_MAHORAGA_QUEUE", "4096"))
+
+# Disk persistence is batched: flush every N events or every T ms
+_PERSIST_BATCH      = int(os.environ.get("HONEYPOT_PERSIST_BATCH", "64"))
+_PERSIST_INTERVAL_S = float(os.environ.get("HONEYPOT_PERSIST_INTERVAL_MS", "50")) / 1000.0
+
+# Submit each flushed batch through io_uring when liburing is installed
+_PERSIST_IO_URING   = os.environ.get("HONEYPOT_PERSIST_IO_URING", "true").lower() == "true"
+_URING_ENTRIES      = 4      # one write SQE in flight per flush
+
+# Format/write bridge log records on a listener thread (see _start_log_queue)
+_ASYNC_LOGGING = os.environ.get("HONEYPOT_ASYNC_LOGGING", "true").lower() == "true"
+
 # Project root storage (same convention as the rest of SwarmShield)
 _HERE        = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.abspath(os.path.join(_HERE, "..", "..", "..", ".."))
@@ -93,10 +146,29 @@ RUNTIME_DIR = os.path.join(PROJECT_ROOT, "swarmshield", "runtime")
 HP_LOG_FILE = os.path.join(RUNTIME_DIR, "honeypot_events.jsonl")
 
 # ---------------------------------------------------------------------------
-# In-memory event buffer (thread-safe deque)
+# In-memory event buffer.  No lock: deque.append (with maxlen eviction),
+# len() and list(deque) each run entirely in C under the GIL, so writers
+# and readers never observe a half-updated buffer.
 # ---------------------------------------------------------------------------
 _event_buffer: deque = deque(maxlen=_MEMORY_BUFFER_SIZE)
-_buffer_lock  = threading.Lock()
+
+# ---------------------------------------------------------------------------
+# Mahoraga feed: one persistent consumer thread drains a bounded queue, so
+# the request handler never spawns a thread per event.
+# ---------------------------------------------------------------------------
+_mahoraga_q: "queue.Queue[HoneypotEvent]" = queue.Queue(maxsize=_MAHORAGA_QUEUE_SIZE)
+_mahoraga_worker: Optional[threading.Thread] = None
+_mahoraga_worker_lock = threading.Lock()
+
+# ---------------------------------------------------------------------------
+# Persistence: handlers append to _persist_q; a flusher thread swaps the
+# pending events out and writes them with one open()/write() per batch.
+# ---------------------------------------------------------------------------
+_persist_q: deque = deque()
+_persist_wake    = threading.Event()
+_persist_io_lock = threading.Lock()     # serialises file writes (flusher vs. explicit flush)
+_persist_worker: Optional[threading.Thread] = None
+_persist_worker_lock = threading.Lock()
 
 # ---------------------------------------------------------------------------
 # Flask app
@@ -104,8 +176,79 @@ _buffer_lock  = threading.Lock()
 app = Flask(__name__)
 
 
-def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+class HoneypotEvent:
+    """
+    One received honeypot observation.
+
+    A slotted record (no per-instance ``__dict__``), so the in-memory ring
+    of recent events stays compact.  Payload keys beyond the known fields —
+    and known fields sent as explicit ``null`` — are kept in ``extra`` so
+    :meth:`to_dict` reproduces the enriched payload.
+    """
+
+    __slots__ = (
+        "source_ip", "attack_type", "confidence", "action_taken", "stats",
+        "received_at", "bridge_id", "extra", "received_ns",
+    )
+
+    _PAYLOAD_FIELDS = ("attack_type", "confidence", "action_taken", "stats")
+
+    def __init__(
+        self,
+        source_ip:    str,
+        received_at:  str,
+        bridge_id:    str,
+        attack_type:  Optional[str] = None,
+        confidence:   Optional[float] = None,
+        action_taken: Optional[str] = None,
+        stats:        Optional[Dict[str, Any]] = None,
+        extra:        Optional[Dict[str, Any]] = None,
+        received_ns:  int = 0,
+    ) -> None:
+        self.source_ip    = source_ip
+        self.attack_type  = attack_type
+        self.confidence   = confidence
+        self.action_taken = action_taken
+        self.stats        = stats
+        self.received_at  = received_at
+        self.bridge_id    = bridge_id
+        self.extra        = extra
+        self.received_ns  = received_ns     # time.time_ns() of receipt; not serialised
+
+    @classmethod
+    def from_payload(
+        cls, data: Dict[str, Any], received_at: str, bridge_id: str,
+        received_ns: int = 0,
+    ) -> "HoneypotEvent":
+        """Build an event from a validated POST payload plus bridge metadata."""
+        known = {
+            k: data[k] for k in cls._PAYLOAD_FIELDS if data.get(k) is not None
+        }
+        extra = {
+            k: v for k, v in data.items()
+            if k not in known and k not in ("source_ip", "received_at", "bridge_id")
+        }
+        return cls(
+            data["source_ip"], received_at, bridge_id,
+            extra=extra or None, received_ns=received_ns, **known,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The JSON shape served by /honeypot_events and written to the log."""
+        d: Dict[str, Any] = {"source_ip": self.source_ip}
+        if self.attack_type is not None:
+            d["attack_type"] = self.attack_type
+        if self.confidence is not None:
+            d["confidence"] = self.confidence
+        if self.action_taken is not None:
+            d["action_taken"] = self.action_taken
+        if self.stats is not None:
+            d["stats"] = self.stats
+        if self.extra:
+            d.update(self.extra)
+        d["received_at"] = self.received_at
+        d["bridge_id"]   = self.bridge_id
+        return d
 
 
 def _default_stats() -> Dict[str, Any]:
@@ -120,7 +263,7 @@ def _default_stats() -> Dict[str, Any]:
     }
 
 
-def _record_to_mahoraga(event: Dict[str, Any]) -> None:
+def _record_to_mahoraga(event: HoneypotEvent) -> None:
     """
     Feed an observed honeypot event to Mahoraga's outcome recorder.
 
@@ -134,123 +277,485 @@ def _record_to_mahoraga(event: Dict[str, Any]) -> None:
         from swarmshield.agents.evolver import Mahoraga  # type: ignore[import]
         m = Mahoraga()
         m.record_outcome(
-            source_ip           = event["source_ip"],
-            stats               = event.get("stats") or _default_stats(),
-            attack_type         = event.get("attack_type", "Unknown"),
-            confidence          = float(event.get("confidence", 0.90)),
-            action_taken        = event.get("action_taken", "redirect_to_honeypot"),
+            source_ip           = event.source_ip,
+            stats               = event.stats or _default_stats(),
+            attack_type         = event.attack_type or "Unknown",
+            confidence          = float(event.confidence if event.confidence is not None else 0.90),
+            action_taken        = event.action_taken or "redirect_to_honeypot",
             enforcement_success = True,
         )
         logger.info(
             "Mahoraga outcome recorded: %s  attack=%s  conf=%.2f",
-            event["source_ip"],
-            event.get("attack_type", "Unknown"),
-            float(event.get("confidence", 0.90)),
+            event.source_ip,
+            event.attack_type or "Unknown",
+            float(event.confidence if event.confidence is not None else 0.90),
         )
     except Exception as exc:
         logger.error("Failed to record outcome to Mahoraga: %s", exc)
 
 
-def _persist_event(event: Dict[str, Any]) -> None:
-    """Append event to the persistent JSONL log on disk."""
+def _dumps(obj: Any) -> bytes:
+    """Serialise *obj* to UTF-8 JSON bytes (orjson when available)."""
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass    # e.g. ints beyond 64 bits — let the stdlib handle it
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse a JSON request body (orjson when available); None if invalid."""
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass    # NaN / Infinity literals — the stdlib is more lenient
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def _dumps_line(event: HoneypotEvent) -> bytes:
+    """Serialise *event* to one UTF-8 JSONL line."""
+    return _dumps(event.to_dict()) + b"\n"
+
+
+def _mahoraga_worker_loop() -> None:
+    """Consume queued events and record each one to Mahoraga (daemon thread)."""
+    while True:
+        event = _mahoraga_q.get()
+        try:
+            _record_to_mahoraga(event)
+        finally:
+            _mahoraga_q.task_done()
+
+
+def _ensure_mahoraga_worker() -> None:
+    """Start the Mahoraga consumer thread on first use."""
+    global _mahoraga_worker
+    if _mahoraga_worker is not None and _mahoraga_worker.is_alive():
+        return
+    with _mahoraga_worker_lock:
+        if _mahoraga_worker is None or not _mahoraga_worker.is_alive():
+            _mahoraga_worker = threading.Thread(
+                target=_mahoraga_worker_loop,
+                name="honeypot-mahoraga",
+                daemon=True,
+            )
+            _mahoraga_worker.start()
+
+
+def _enqueue_for_mahoraga(event: HoneypotEvent) -> None:
+    """Hand *event* to the Mahoraga worker without blocking the request."""
+    _ensure_mahoraga_worker()
     try:
-        os.makedirs(os.path.dirname(HP_LOG_FILE), exist_ok=True)
-        with open(HP_LOG_FILE, "a") as fh:
-            fh.write(json.dumps(event) + "\n")
-    except OSError as exc:
-        logger.error("Could not write honeypot event to disk: %s", exc)
+        _mahoraga_q.put_nowait(event)
+    except queue.Full:
+        logger.warning(
+            "Mahoraga queue full (%d) — dropping outcome for %s",
+            _MAHORAGA_QUEUE_SIZE, event.source_ip,
+        )
+
+
+class _UringAppender:
+    """
+    Append JSONL lines to one file through io_uring.
+
+    The file is opened ``O_APPEND`` and registered with the ring once, so
+    submissions skip the per-call fd lookup.  Each batch is coalesced into
+    one buffer and written with a single SQE: the kernel pins and copies
+    one contiguous region instead of one small buffer per line.  Callers
+    must serialise access (the flusher holds ``_persist_io_lock``).
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._ring = liburing.Ring()
+        self._cqe  = liburing.Cqe()
+        liburing.io_uring_queue_init(_URING_ENTRIES, self._ring, 0)
+        try:
+            self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            self._files = liburing.FileIndex([self._fd])
+            liburing.io_uring_register_files(self._ring, self._files)
+        except Exception:
+            liburing.io_uring_queue_exit(self._ring)
+            raise
+
+    def write_lines(self, lines: List[bytes]) -> int:
+        """Write *lines* in order; return how many were fully written."""
+        payload = b"".join(lines)
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        liburing.io_uring_prep_write(sqe, 0, payload, 0)       # fixed file #0
+        liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_FIXED_FILE)
+        liburing.io_uring_submit_and_wait(self._ring, 1)
+        liburing.io_uring_wait_cqe(self._ring, self._cqe)
+        res = self._cqe[0].res
+        liburing.io_uring_cq_advance(self._ring, 1)
+        if res == len(payload):
+            return len(lines)
+
+        # Error (res < 0) or short write: report the whole lines that landed
+        written, end = 0, 0
+        for buf in lines:
+            end += len(buf)
+            if end > res:
+                break
+            written += 1
+        return written
+
+    def close(self) -> None:
+        liburing.io_uring_unregister_files(self._ring)
+        liburing.io_uring_queue_exit(self._ring)
+        os.close(self._fd)
+
+
+_uring_appender: Optional[_UringAppender] = None
+_uring_disabled = not (_LIBURING_AVAILABLE and _PERSIST_IO_URING)
+
+
+def _get_uring_appender() -> Optional[_UringAppender]:
+    """Return an appender for the current HP_LOG_FILE, or None to use plain writes."""
+    global _uring_appender, _uring_disabled
+    if _uring_disabled:
+        return None
+    if _uring_appender is not None and _uring_appender.path != HP_LOG_FILE:
+        _uring_appender.close()
+        _uring_appender = None
+    if _uring_appender is None:
+        try:
+            _uring_appender = _UringAppender(HP_LOG_FILE)
+        except Exception as exc:   # no io_uring in this kernel / sandbox
+            logger.warning("io_uring unavailable (%s) — using buffered writes.", exc)
+            _uring_disabled = True
+            return None
+    return _uring_appender
+
+
+def _write_lines(lines: List[bytes]) -> None:
+    """Append *lines* to HP_LOG_FILE (io_uring when possible, else one write)."""
+    global _uring_appender, _uring_disabled
+    appender = _get_uring_appender()
+    if appender is not None:
+        done = appender.write_lines(lines)
+        if done == len(lines):
+            return
+        logger.warning(
+            "io_uring write failed after %d/%d line(s) — falling back to buffered writes.",
+            done, len(lines),
+        )
+        appender.close()
+        _uring_appender = None
+        _uring_disabled = True
+        lines = lines[done:]
+    with open(HP_LOG_FILE, "ab") as fh:
+        fh.write(b"".join(lines))
+
+
+def _flush_persist_queue() -> int:
+    """
+    Write every pending event to the JSONL log as one batch.
+
+    Returns the number of events written.  Safe to call from any thread;
+    also registered with :mod:`atexit` so a clean shutdown loses nothing.
+    """
+    with _persist_io_lock:
+        batch: List[HoneypotEvent] = []
+        try:
+            while True:
+                batch.append(_persist_q.popleft())
+        except IndexError:
+            pass
+        if not batch:
+            return 0
+        try:
+            os.makedirs(os.path.dirname(HP_LOG_FILE), exist_ok=True)
+            _write_lines([_dumps_line(e) for e in batch])
+        except OSError as exc:
+            logger.error("Could not write %d honeypot event(s) to disk: %s", len(batch), exc)
+        return len(batch)
+
+
+def _persist_worker_loop() -> None:
+    """Flush the persist queue every _PERSIST_INTERVAL_S or on a full batch."""
+    while True:
+        _persist_wake.wait(_PERSIST_INTERVAL_S)
+        _persist_wake.clear()
+        _flush_persist_queue()
+
+
+def _ensure_persist_worker() -> None:
+    """Start the persistence flusher thread on first use."""
+    global _persist_worker
+    if _persist_worker is not None and _persist_worker.is_alive():
+        return
+    with _persist_worker_lock:
+        if _persist_worker is None or not _persist_worker.is_alive():
+            _persist_worker = threading.Thread(
+                target=_persist_worker_loop,
+                name="honeypot-persist",
+                daemon=True,
+            )
+            _persist_worker.start()
+
+
+def _persist_event(event: HoneypotEvent) -> None:
+    """Queue *event* for the persistent JSONL log (written in batches)."""
+    _ensure_persist_worker()
+    _persist_q.append(event)
+    if len(_persist_q) >= _PERSIST_BATCH:
+        _persist_wake.set()
+
+
+atexit.register(_flush_persist_queue)
 
 
 # ===========================================================================
-# Flask routes
+# Request handling (shared by the Flask and aiohttp front-ends)
 # ===========================================================================
 
-@app.route("/honeypot_event", methods=["POST"])
-def receive_honeypot_event():
+def _ingest_event(data: Any) -> Tuple[Dict[str, Any], int, Optional[HoneypotEvent]]:
     """
-    Receive an attacker observation from the honeypot.
-
-    Required field: ``source_ip``
-    Recommended:    ``attack_type``, ``confidence``, ``action_taken``
-    Optional:       ``stats`` (dict of traffic metrics)
+    Validate and buffer one honeypot payload.
 
-    Returns 200 on success, 400 on missing/invalid payload.
+    Returns ``(response_body, http_status, event)``; *event* is None when
+    the payload was rejected.  Never blocks on disk: persistence is only
+    queued here and written by the flusher thread.
     """
-    data = request.get_json(silent=True)
-    if not data:
-        return jsonify({"error": "Invalid or missing JSON payload"}), 400
+    if not data or not isinstance(data, dict):
+        return {"error": "Invalid or missing JSON payload"}, 400, None
 
     if "source_ip" not in data:
-        return jsonify({"error": "Missing required field: source_ip"}), 400
+        return {"error": "Missing required field: source_ip"}, 400, None
 
     # Enrich with timestamp and bridge metadata
-    event: Dict[str, Any] = {
-        **data,
-        "received_at": _now_iso(),
-        "bridge_id":   BRIDGE_AGENT_ID,
-    }
+    received_ns = time.time_ns()
+    event = HoneypotEvent.from_payload(
+        data, _iso_from_ns(received_ns), BRIDGE_AGENT_ID, received_ns,
+    )
 
     # Buffer in memory
-    with _buffer_lock:
-        _event_buffer.append(event)
+    _event_buffer.append(event)
 
-    # Persist to disk
+    # Queue for the on-disk log (batched by the flusher thread)
     _persist_event(event)
 
     # Feed Mahoraga's evolution loop (non-blocking)
-    t = threading.Thread(
-        target=_record_to_mahoraga,
-        args=(event,),
-        daemon=True,
-    )
-    t.start()
+    _enqueue_for_mahoraga(event)
 
-    logger.info(
-        "Honeypot event received: %s  attack=%s  conf=%s",
-        event["source_ip"],
-        event.get("attack_type", "?"),
-        event.get("confidence", "?"),
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Honeypot event received: %s  attack=%s  conf=%s",
+            event.source_ip,
+            event.attack_type if event.attack_type is not None else "?",
+            event.confidence if event.confidence is not None else "?",
+        )
 
-    return jsonify({
+    return {
         "status":      "recorded",
-        "source_ip":   event["source_ip"],
-        "received_at": event["received_at"],
+        "source_ip":   event.source_ip,
+        "received_at": event.received_at,
         "bridge_id":   BRIDGE_AGENT_ID,
-    }), 200
+    }, 200, event
 
 
-@app.route("/honeypot_events", methods=["GET"])
-def list_honeypot_events():
-    """
-    Return recent honeypot events.
-    Query param: ``?limit=50`` (default 50, max 500).
-    """
+def _parse_limit(raw: Optional[str]) -> int:
+    """Clamp the ``?limit=`` query parameter (default 50, max buffer size)."""
     try:
-        limit = min(int(request.args.get("limit", 50)), _MEMORY_BUFFER_SIZE)
+        return min(int(raw if raw is not None else 50), _MEMORY_BUFFER_SIZE)
     except ValueError:
-        limit = 50
+        return 50
+
+
+def _recent_events(limit: int) -> Dict[str, Any]:
+    """Body for GET /honeypot_events — most recent first."""
+    # One pass from the newest end; list(islice(...)) runs entirely in C,
+    # so a concurrent append cannot interleave with the walk.
+    events = list(islice(reversed(_event_buffer), limit if limit > 0 else None))
+
+    return {
+        "event_count": len(events),
+        "events":      [e.to_dict() for e in events],
+        "bridge_id":   BRIDGE_AGENT_ID,
+    }
+
+
+def _column_confidence(event: HoneypotEvent) -> Optional[float]:
+    try:
+        return float(event.confidence) if event.confidence is not None else None
+    except (TypeError, ValueError):
+        return None
 
-    with _buffer_lock:
-        events = list(_event_buffer)[-limit:]
 
-    return jsonify({
+def _recent_event_columns(limit: int) -> Dict[str, Any]:
+    """
+    Body for GET /honeypot_events?format=columns — most recent first.
+
+    Built from ``_event_buffer`` on request, so ingest keeps a single copy
+    of each event; only clients that ask for this view pay for it.
+    """
+    events = list(islice(reversed(_event_buffer), limit if limit > 0 else None))
+    return {
         "event_count": len(events),
-        "events":      list(reversed(events)),   # most recent first
+        "columns": {
+            "source_ip":   [e.source_ip for e in events],
+            "received_ns": [e.received_ns for e in events],
+            "attack_type": [
+                str(e.attack_type) if e.attack_type is not None else None for e in events
+            ],
+            "confidence":  [_column_confidence(e) for e in events],
+        },
         "bridge_id":   BRIDGE_AGENT_ID,
-    }), 200
+    }
+
+
+def _health() -> Dict[str, Any]:
+    """Body for GET /honeypot_health."""
+    return {
+        "status":         "alive",
+        "bridge_id":      BRIDGE_AGENT_ID,
+        "buffered_events": len(_event_buffer),
+    }
+
+
+# ===========================================================================
+# Flask routes
+# ===========================================================================
+
+def _json_response(body: Dict[str, Any], status: int = 200):
+    """Flask response with a pre-serialised JSON body (bypasses jsonify)."""
+    return app.response_class(_dumps(body), status=status, mimetype="application/json")
+
+
+@app.route("/honeypot_event", methods=["POST"])
+def receive_honeypot_event():
+    """
+    Receive an attacker observation from the honeypot.
+
+    Required field: ``source_ip``
+    Recommended:    ``attack_type``, ``confidence``, ``action_taken``
+    Optional:       ``stats`` (dict of traffic metrics)
+
+    Returns 200 on success, 400 on missing/invalid payload.
+    """
+    data = _loads(request.get_data(cache=False)) if request.is_json else None
+    body, status, _event = _ingest_event(data)
+    return _json_response(body, status)
+
+
+@app.route("/honeypot_events", methods=["GET"])
+def list_honeypot_events():
+    """
+    Return recent honeypot events.
+    Query params: ``?limit=50`` (default 50, max 500);
+    ``?format=columns`` returns scalar fields as parallel arrays.
+    """
+    limit = _parse_limit(request.args.get("limit"))
+    if request.args.get("format") == "columns":
+        return _json_response(_recent_event_columns(limit))
+    return _json_response(_recent_events(limit))
 
 
 @app.route("/honeypot_health", methods=["GET"])
 def honeypot_health():
     """Liveness probe."""
-    with _buffer_lock:
-        buffered = len(_event_buffer)
-    return jsonify({
-        "status":         "alive",
-        "bridge_id":      BRIDGE_AGENT_ID,
-        "buffered_events": buffered,
-    }), 200
+    return _json_response(_health())
+
+
+# ===========================================================================
+# Optional asyncio front-end (aiohttp, on uvloop when installed)
+# ===========================================================================
+
+def build_async_app() -> "aiohttp_web.Application":
+    """
+    Build an aiohttp application exposing the same three endpoints.
+
+    Handlers never block the event loop: disk writes happen on the
+    persistence flusher thread.
+    """
+    if not _AIOHTTP_AVAILABLE:
+        raise RuntimeError(
+            "aiohttp is not installed.  Install it with:\n  pip install aiohttp"
+        )
+
+    def _aio_json(body: Dict[str, Any], status: int = 200) -> "aiohttp_web.Response":
+        return aiohttp_web.Response(
+            body=_dumps(body), status=status, content_type="application/json",
+        )
+
+    async def _receive(req: "aiohttp_web.Request") -> "aiohttp_web.Response":
+        body, status, _event = _ingest_event(_loads(await req.read()))
+        return _aio_json(body, status)
+
+    async def _list(req: "aiohttp_web.Request") -> "aiohttp_web.Response":
+        limit = _parse_limit(req.query.get("limit"))
+        if req.query.get("format") == "columns":
+            return _aio_json(_recent_event_columns(limit))
+        return _aio_json(_recent_events(limit))
+
+    async def _health_route(_req: "aiohttp_web.Request") -> "aiohttp_web.Response":
+        return _aio_json(_health())
+
+    aio_app = aiohttp_web.Application()
+    aio_app.add_routes([
+        aiohttp_web.post("/honeypot_event",  _receive),
+        aiohttp_web.get("/honeypot_events",  _list),
+        aiohttp_web.get("/honeypot_health",  _health_route),
+    ])
+    return aio_app
+
+
+def _run_async_bridge(host: str, port: int) -> None:
+    """Serve build_async_app() on a fresh (uvloop if available) event loop."""
+    loop = uvloop.new_event_loop() if _UVLOOP_AVAILABLE else asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    # handle_signals=False so the bridge can run in a background thread
+    aiohttp_web.run_app(
+        build_async_app(), host=host, port=port,
+        handle_signals=False, print=None, loop=loop,
+    )
+
+
+# ===========================================================================
+# Off-thread logging
+# ===========================================================================
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _start_log_queue() -> None:
+    """
+    Send this module's and werkzeug's per-request records through a queue.
+
+    Request threads then only enqueue a LogRecord; a QueueListener thread
+    formats and writes it using the root logger's handlers.  No-op when
+    ``HONEYPOT_ASYNC_LOGGING=false`` or the root logger has no handlers.
+    """
+    global _log_listener
+    if _log_listener is not None or not _ASYNC_LOGGING:
+        return
+    root_handlers = logging.getLogger().handlers
+    if not root_handlers:
+        return
+    log_q: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_q, *root_handlers, respect_handler_level=True,
+    )
+    handler = _DeferredQueueHandler(log_q)
+    for name in (logger.name, "werkzeug"):
+        lg = logging.getLogger(name)
+        lg.addHandler(handler)
+        lg.propagate = False
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
 
 # ===========================================================================
@@ -260,8 +765,27 @@ def honeypot_health():
 def run_bridge(
     host: str = BRIDGE_HOST,
     port: int = BRIDGE_PORT,
+    use_async: Optional[bool] = None,
 ) -> None:
-    """Start the bridge server (blocking)."""
+    """
+    Start the bridge server (blocking).
+
+    *use_async* selects the aiohttp front-end; it defaults to the
+    ``HONEYPOT_BRIDGE_ASYNC`` env var and falls back to Flask when aiohttp
+    is not installed.
+    """
+    _start_log_queue()
+    if use_async is None:
+        use_async = os.environ.get("HONEYPOT_BRIDGE_ASYNC", "false").lower() == "true"
+    if use_async and _AIOHTTP_AVAILABLE:
+        logger.info(
+            "HoneypotBridge starting on %s:%d (aiohttp%s)",
+            host, port, " + uvloop" if _UVLOOP_AVAILABLE else "",
+        )
+        _run_async_bridge(host, port)
+        return
+    if use_async:
+        logger.warning("aiohttp not installed — HoneypotBridge falling back to Flask.")
     logger.info("HoneypotBridge starting on %s:%d", host, port)
     app.run(host=host, port=port, use_reloader=False, threaded=True)
 
@@ -5,15 +5,26 @@ import subprocess
 import threading
 import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Tuple
 
 try:
     from .llm_client import LLMClient as _LLMClient
 except ImportError:
     _LLMClient = None  # type: ignore[assignment,misc]
 
+# Optional fast JSON for request/response bodies — Flask's stdlib-backed
+# provider is used unchanged when orjson is not installed.
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 import requests
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+from ..utils.timefmt import now_iso as _now_iso
 
 # ---------------------------------------------------------------------------
 # Logging setup
@@ -70,21 +81,67 @@ CONFIRMED_CONFIDENCE_GATE      = float(os.environ.get("CONFIRMED_CONFIDENCE_GATE
 PREEMPTIVE_AUTO_EXPIRE_SECONDS = int(os.environ.get("PREEMPTIVE_EXPIRE_SECONDS",       "60"))
 PREEMPTIVE_RATE_LIMIT_PPS      = int(os.environ.get("PREEMPTIVE_RATE_LIMIT_PPS",       "100"))
 
+# Apply iptables rules through one persistent ``iptables-restore --noflush``
+# process instead of one ``iptables`` fork/exec per rule (see _run_rule).
+IPTABLES_RESTORE = os.environ.get("RESPONDER_IPTABLES_RESTORE", "false").lower() == "true"
+
+# Largest request body accepted (bytes).  Legitimate verdicts are well under
+# 1 KiB; anything larger is refused with 413 before it is read or parsed.
+MAX_REQUEST_BYTES = int(os.environ.get("RESPONDER_MAX_REQUEST_BYTES", "4096"))
+
 # ---------------------------------------------------------------------------
 # Flask app
 # ---------------------------------------------------------------------------
+class _ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Honours the provider's ``sort_keys`` and pretty-print (``indent``)
+    settings; anything orjson rejects (ints beyond 64 bits, stdlib-only
+    keyword arguments, NaN literals on input) goes through the stdlib
+    implementation of the parent class.
+    """
+
+    _ORJSON_KWARGS = frozenset({"default", "ensure_ascii", "indent", "separators", "sort_keys"})
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs.keys() <= self._ORJSON_KWARGS:
+            option = orjson.OPT_NON_STR_KEYS
+            if kwargs.get("sort_keys", self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            if kwargs.get("indent"):
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(
+                    obj, default=kwargs.get("default", self.default), option=option,
+                ).decode()
+            except TypeError:
+                pass
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if not kwargs:
+            try:
+                return orjson.loads(s)
+            except orjson.JSONDecodeError:
+                pass
+        return super().loads(s, **kwargs)
+
+
 app = Flask(__name__)
+if _ORJSON_AVAILABLE:
+    app.json = _ORJSONProvider(app)
+# Verdict responses are small machine-read dicts: keep insertion order and
+# skip pretty-printing even when the app runs with debug=True.
+app.json.sort_keys = False
+app.json.compact   = True
+app.config["MAX_CONTENT_LENGTH"] = MAX_REQUEST_BYTES
 
 
 # ===========================================================================
 # Helper utilities
 # ===========================================================================
 
-def _now_iso() -> str:
-    """Return current UTC time as ISO-8601 string."""
-    return datetime.now(timezone.utc).isoformat()
-
-
 def _run_cmd(args: list) -> bool:
     """
     Run a shell command safely (shell=False).
@@ -118,6 +175,71 @@ def _run_cmd(args: list) -> bool:
         return False
 
 
+_ipt_restore: Optional[subprocess.Popen] = None
+_ipt_restore_lock = threading.Lock()
+
+
+def _ipt_restore_pipe() -> Optional[subprocess.Popen]:
+    """Return the live iptables-restore process, (re)spawning it if needed."""
+    global _ipt_restore
+    proc = _ipt_restore
+    if proc is not None and proc.poll() is None:
+        return proc
+    if proc is not None:
+        logger.warning("iptables-restore exited (rc=%s) — respawning.", proc.returncode)
+    try:
+        _ipt_restore = subprocess.Popen(
+            ["sudo", "iptables-restore", "--noflush"],
+            stdin=subprocess.PIPE,
+            text=True,
+        )
+    except OSError as exc:
+        logger.error("Could not start iptables-restore: %s", exc)
+        _ipt_restore = None
+    return _ipt_restore
+
+
+def _run_rule(rule: list, table: str = "filter") -> bool:
+    """
+    Apply one iptables *rule* (the arguments after ``iptables [-t table]``).
+
+    By default runs ``sudo iptables …`` through :func:`_run_cmd`.  With
+    RESPONDER_IPTABLES_RESTORE=true the rule is written as a one-rule
+    transaction to a long-lived ``iptables-restore --noflush`` instead,
+    avoiding a fork/exec per rule.  That path has no per-rule exit status:
+    True means the rule was handed to iptables-restore, and a rejected
+    rule is only noticed when the process exits and is respawned.
+    """
+    if not IPTABLES_RESTORE:
+        table_args = ["-t", table] if table != "filter" else []
+        return _run_cmd(["sudo", "iptables", *table_args, *rule])
+
+    with _ipt_restore_lock:
+        for _ in range(2):              # one retry after a dead pipe
+            proc = _ipt_restore_pipe()
+            if proc is None:
+                return False
+            try:
+                proc.stdin.write(f"*{table}\n{' '.join(rule)}\nCOMMIT\n")
+                proc.stdin.flush()
+                logger.info("RULE OK (iptables-restore): -t %s %s", table, " ".join(rule))
+                return True
+            except OSError as exc:          # incl. BrokenPipeError
+                logger.warning("iptables-restore pipe failed: %s", exc)
+                _drop_ipt_restore(proc)
+    return False
+
+
+def _drop_ipt_restore(proc: subprocess.Popen) -> None:
+    """Forget a broken iptables-restore process so the next rule respawns it."""
+    global _ipt_restore
+    _ipt_restore = None
+    try:
+        proc.stdin.close()
+    except OSError:
+        pass
+
+
 # ===========================================================================
 # Core action functions
 # ===========================================================================
@@ -127,18 +249,20 @@ def block_ip(ip_address: str) -> bool:
     Add ip_address to blocked_ips.txt and install an iptables DROP rule.
     Returns True if the iptables command succeeded.
     """
-    # Persist to file
+    # Persist to the blocked-IP journal; response_tool deduplicates and
+    # compacts it (import deferred to keep the standalone service light)
     try:
+        from ..tools.response_tool import save_blocked_ip
         os.makedirs(os.path.dirname(BLOCKED_IPS_FILE), exist_ok=True)
-        with open(BLOCKED_IPS_FILE, "a") as fh:
-            fh.write(f"{ip_address}\n")
-        logger.info("Added %s to %s", ip_address, BLOCKED_IPS_FILE)
+        if save_blocked_ip(ip_address, BLOCKED_IPS_FILE):
+            logger.info("Added %s to %s", ip_address, BLOCKED_IPS_FILE)
+        else:
+            logger.info("%s already listed in %s", ip_address, BLOCKED_IPS_FILE)
     except OSError as exc:
         logger.error("Could not write to %s: %s", BLOCKED_IPS_FILE, exc)
 
     # iptables rule
-    cmd = ["sudo", "iptables", "-A", "INPUT", "-s", ip_address, "-j", "DROP"]
-    success = _run_cmd(cmd)
+    success = _run_rule(["-A", "INPUT", "-s", ip_address, "-j", "DROP"])
     log_action(ip_address, "block", AGENT_ID, success)
     return success
 
@@ -148,15 +272,12 @@ def redirect_to_honeypot(ip_address: str) -> bool:
     Redirect traffic from ip_address to the honeypot via DNAT.
     Returns True if the iptables command succeeded.
     """
-    cmd = [
-        "sudo", "iptables",
-        "-t", "nat",
+    success = _run_rule([
         "-A", "PREROUTING",
         "-s", ip_address,
         "-j", "DNAT",
         "--to-destination", HONEYPOT_IP,
-    ]
-    success = _run_cmd(cmd)
+    ], table="nat")
     if success:
         logger.info("Redirected %s → honeypot %s", ip_address, HONEYPOT_IP)
     log_action(ip_address, "redirect_to_honeypot", AGENT_ID, success)
@@ -168,14 +289,8 @@ def quarantine_host(ip_address: str) -> bool:
     Block all forwarded traffic to/from ip_address without taking the
     machine fully offline.  Returns True if both iptables rules succeeded.
     """
-    cmd_src = [
-        "sudo", "iptables", "-A", "FORWARD", "-s", ip_address, "-j", "DROP"
-    ]
-    cmd_dst = [
-        "sudo", "iptables", "-A", "FORWARD", "-d", ip_address, "-j", "DROP"
-    ]
-    s1 = _run_cmd(cmd_src)
-    s2 = _run_cmd(cmd_dst)
+    s1 = _run_rule(["-A", "FORWARD", "-s", ip_address, "-j", "DROP"])
+    s2 = _run_rule(["-A", "FORWARD", "-d", ip_address, "-j", "DROP"])
     success = s1 and s2
     log_action(ip_address, "quarantine", AGENT_ID, success)
     return success
@@ -186,23 +301,16 @@ def unblock_ip(ip_address: str) -> bool:
     Remove ip_address from blocked_ips.txt and delete the iptables DROP rule.
     Returns True if the iptables command succeeded.
     """
-    # Remove from file
+    # Remove from the journal; a tombstone is only written for listed IPs
     try:
-        os.makedirs(os.path.dirname(BLOCKED_IPS_FILE), exist_ok=True)
-        if os.path.exists(BLOCKED_IPS_FILE):
-            with open(BLOCKED_IPS_FILE, "r") as fh:
-                lines = fh.readlines()
-            with open(BLOCKED_IPS_FILE, "w") as fh:
-                for line in lines:
-                    if line.strip() != ip_address:
-                        fh.write(line)
+        from ..tools.response_tool import remove_blocked_ip
+        if remove_blocked_ip(ip_address, BLOCKED_IPS_FILE):
             logger.info("Removed %s from %s", ip_address, BLOCKED_IPS_FILE)
     except OSError as exc:
         logger.error("Could not update %s: %s", BLOCKED_IPS_FILE, exc)
 
     # Delete iptables rule
-    cmd = ["sudo", "iptables", "-D", "INPUT", "-s", ip_address, "-j", "DROP"]
-    success = _run_cmd(cmd)
+    success = _run_rule(["-D", "INPUT", "-s", ip_address, "-j", "DROP"])
     log_action(ip_address, "unblock", AGENT_ID, success)
     return success
 
@@ -212,15 +320,12 @@ def remove_redirect(ip_address: str) -> bool:
     Remove the DNAT redirect rule for ip_address.
     Returns True if the iptables command succeeded.
     """
-    cmd = [
-        "sudo", "iptables",
-        "-t", "nat",
+    success = _run_rule([
         "-D", "PREROUTING",
         "-s", ip_address,
         "-j", "DNAT",
         "--to-destination", HONEYPOT_IP,
-    ]
-    success = _run_cmd(cmd)
+    ], table="nat")
     log_action(ip_address, "remove_redirect", AGENT_ID, success)
     return success
 
@@ -243,16 +348,15 @@ def rate_limit_ip(
     Returns True if the iptables command succeeded.
     """
     rule_name = f"rl_{ip_address.replace('.', '_')}"
-    cmd = [
-        "sudo", "iptables", "-A", "INPUT",
+    success = _run_rule([
+        "-A", "INPUT",
         "-s", ip_address,
         "-m", "hashlimit",
         "--hashlimit-name",  rule_name,
         "--hashlimit-above", f"{pps_limit}/sec",
         "--hashlimit-mode",  "srcip",
         "-j", "DROP",
-    ]
-    success = _run_cmd(cmd)
+    ])
     if success:
         logger.info(
             "Rate-limited %s at %d pps (auto-expires in %ds)",
@@ -271,16 +375,15 @@ def remove_rate_limit(
     Returns True if the iptables command succeeded.
     """
     rule_name = f"rl_{ip_address.replace('.', '_')}"
-    cmd = [
-        "sudo", "iptables", "-D", "INPUT",
+    success = _run_rule([
+        "-D", "INPUT",
         "-s", ip_address,
         "-m", "hashlimit",
         "--hashlimit-name",  rule_name,
         "--hashlimit-above", f"{pps_limit}/sec",
         "--hashlimit-mode",  "srcip",
         "-j", "DROP",
-    ]
-    success = _run_cmd(cmd)
+    ])
     log_action(ip_address, "remove_rate_limit", AGENT_ID, success)
     return success
 
@@ -686,6 +789,18 @@ def _llm_validate_action(
 # Flask routes
 # ===========================================================================
 
+# Required top-level payload fields per endpoint (built once, not per request)
+_VERDICT_REQUIRED: Tuple[str, ...] = (
+    "source_ip", "predicted_attack_type", "confidence",
+    "shap_explanation", "recommended_action", "agent_id",
+)
+_PREEMPTIVE_REQUIRED: Tuple[str, ...] = (
+    "source_ip", "alert_level", "current_confidence",
+    "predicted_confidence", "recommended_action", "agent_id",
+)
+_CIC_BLOCK_REQUIRED: Tuple[str, ...] = ("source_ip", "cic_label", "confidence")
+
+
 @app.route("/verdict", methods=["POST"])
 def verdict_endpoint():
     """
@@ -699,11 +814,7 @@ def verdict_endpoint():
     if not data:
         return jsonify({"error": "Invalid or missing JSON payload"}), 400
 
-    required = [
-        "source_ip", "predicted_attack_type", "confidence",
-        "shap_explanation", "recommended_action", "agent_id",
-    ]
-    missing = [f for f in required if f not in data]
+    missing = [f for f in _VERDICT_REQUIRED if f not in data]
     if missing:
         return jsonify({"error": f"Missing fields: {missing}"}), 400
 
@@ -745,11 +856,7 @@ def preemptive_action_endpoint():
     if not data:
         return jsonify({"error": "Invalid or missing JSON payload"}), 400
 
-    required = [
-        "source_ip", "alert_level", "current_confidence",
-        "predicted_confidence", "recommended_action", "agent_id",
-    ]
-    missing = [f for f in required if f not in data]
+    missing = [f for f in _PREEMPTIVE_REQUIRED if f not in data]
     if missing:
         return jsonify({"error": f"Missing fields: {missing}"}), 400
 
@@ -825,8 +932,7 @@ def cic_block_endpoint():
     if not data:
         return jsonify({"error": "Invalid or missing JSON payload"}), 400
 
-    required = ["source_ip", "cic_label", "confidence"]
-    missing  = [f for f in required if f not in data]
+    missing = [f for f in _CIC_BLOCK_REQUIRED if f not in data]
     if missing:
         return jsonify({"error": f"Missing fields: {missing}"}), 400
 
@@ -876,6 +982,12 @@ def cic_block_endpoint():
     }), 200
 
 
+@app.errorhandler(413)
+def request_too_large(_exc):
+    """JSON body for requests over MAX_REQUEST_BYTES (MAX_CONTENT_LENGTH)."""
+    return jsonify({"error": f"Request body exceeds {MAX_REQUEST_BYTES} bytes"}), 413
+
+
 @app.route("/health", methods=["GET"])
 def health():
     """Liveness probe."""
@@ -7,6 +7,8 @@ from collections import Counter, deque
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 try:
     from .llm_client import LLMClient
 except ImportError:
@@ -278,6 +280,49 @@ def _monte_carlo_estimate(
     }
 
 
+# Column order of the batched Monte Carlo inputs: each metric is tested
+# against the threshold at the same position.
+_MC_METRICS = (
+    "packets_per_second", "syn_count", "unique_dest_ips",
+    "port_entropy", "bytes_per_second",
+)
+_MC_THRESHOLDS = (
+    "ddos_pps_threshold", "ddos_syn_threshold", "port_scan_unique_ip_thresh",
+    "port_scan_entropy_threshold", "exfil_bps_threshold",
+)
+
+
+def _monte_carlo_confidences(
+    metrics: np.ndarray,
+    thresholds: np.ndarray,
+    n_simulations: int = N_SIMULATIONS,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Array form of the ``_monte_carlo_estimate`` threat rules.
+
+    *metrics* (``..., 5``) follows ``_MC_METRICS`` and *thresholds*
+    (``..., 5``) follows ``_MC_THRESHOLDS``; the two broadcast against each
+    other, so one call can score many stat rows under many threshold sets,
+    with independent noise for every pair.
+
+    Returns
+    -------
+    numpy.ndarray
+        Shape ``(..., 3)``: ddos, port_scan and exfiltration confidences.
+    """
+    rng   = rng or np.random.default_rng()
+    shape = np.broadcast_shapes(metrics.shape, thresholds.shape)[:-1]
+    v     = metrics[..., None, :]
+    noisy = np.maximum(0.0, v + v * rng.normal(0, 0.10, shape + (n_simulations, 5)))
+    hit   = noisy >= thresholds[..., None, :]
+    return np.stack([
+        (hit[..., 0] | hit[..., 1]).mean(axis=-1),
+        (hit[..., 2] | hit[..., 3]).mean(axis=-1),
+        hit[..., 4].mean(axis=-1),
+    ], axis=-1)
+
+
 def _capitalise_attack(top_threat: str) -> str:
     mapping = {
         "ddos":         "DDoS",
@@ -327,6 +372,29 @@ def _log_detection(
         logger.warning("Could not write to %s: %s", log_file, exc)
 
 
+def _synthetic_host(
+    src_ip: str,
+    dst_ips: List[str],
+    dst_ports: List[int],
+    sizes: List[int],
+    timestamps: List[float],
+    is_syn: bool,
+) -> List[dict]:
+    """Zip pre-drawn per-packet columns into canonical packet dicts."""
+    return [
+        {
+            "src_ip":    src_ip,
+            "dst_ip":    dst,
+            "dst_port":  port,
+            "protocol":  "TCP",
+            "size":      size,
+            "timestamp": ts,
+            "is_syn":    is_syn,
+        }
+        for dst, port, size, ts in zip(dst_ips, dst_ports, sizes, timestamps)
+    ]
+
+
 def _simulate_packets(window_seconds: int = WINDOW_SECONDS) -> list:
     """
     Generate a realistic mix of synthetic packet metadata for one analysis
@@ -334,47 +402,36 @@ def _simulate_packets(window_seconds: int = WINDOW_SECONDS) -> list:
         - 10.0.0.1  — SYN-flood attacker (DDoS pattern)
         - 10.0.0.2  — port scanner (PortScan pattern)
         - 10.0.0.3  — normal host
+
+    Every random column is drawn in one NumPy call per host; only the final
+    dict assembly is a Python loop.
     """
     now = time.time()
-    packets: list = []
-    rng = random.Random(42)
+    rng = np.random.default_rng(42)
+
+    def stamps(n: int) -> List[float]:
+        return (now - rng.uniform(0, window_seconds, n)).tolist()
 
     # DDoS attacker — 600 SYN packets in 10 s → 60 pps (above threshold when
     # combined with high SYN count over the window)
-    for i in range(600):
-        packets.append({
-            "src_ip":    "10.0.0.1",
-            "dst_ip":    "192.168.1.100",
-            "dst_port":  80,
-            "protocol":  "TCP",
-            "size":      60,
-            "timestamp": now - rng.uniform(0, window_seconds),
-            "is_syn":    True,
-        })
+    packets = _synthetic_host(
+        "10.0.0.1", ["192.168.1.100"] * 600, [80] * 600, [60] * 600,
+        stamps(600), is_syn=True,
+    )
 
     # Port scanner — 50 packets to 40 different destination IPs
-    for i in range(50):
-        packets.append({
-            "src_ip":    "10.0.0.2",
-            "dst_ip":    f"192.168.1.{rng.randint(1, 254)}",
-            "dst_port":  rng.randint(1, 65535),
-            "protocol":  "TCP",
-            "size":      64,
-            "timestamp": now - rng.uniform(0, window_seconds),
-            "is_syn":    True,
-        })
+    octets = rng.integers(1, 255, 50).tolist()
+    packets += _synthetic_host(
+        "10.0.0.2", [f"192.168.1.{o}" for o in octets],
+        rng.integers(1, 65536, 50).tolist(), [64] * 50,
+        stamps(50), is_syn=True,
+    )
 
     # Normal host — 10 regular HTTP packets
-    for i in range(10):
-        packets.append({
-            "src_ip":    "10.0.0.3",
-            "dst_ip":    "8.8.8.8",
-            "dst_port":  443,
-            "protocol":  "TCP",
-            "size":      rng.randint(200, 1400),
-            "timestamp": now - rng.uniform(0, window_seconds),
-            "is_syn":    False,
-        })
+    packets += _synthetic_host(
+        "10.0.0.3", ["8.8.8.8"] * 10, [443] * 10,
+        rng.integers(200, 1401, 10).tolist(), stamps(10), is_syn=False,
+    )
 
     return packets
 
@@ -487,6 +487,13 @@ def main() -> None:
     scout    = ScoutAgent(packet_source=packet_source)
     analyzer = AnalyzerAgent()
 
+    # Load the CIC-ML model in the background before the first cic_screen()
+    try:
+        from swarmshield.utils.ml_classifier import preload as _cic_preload
+        _cic_preload()
+    except ImportError:
+        pass
+
     # ----------------------------------------------------------------
     # 3b. Start A2A message bus subscriptions
     # ----------------------------------------------------------------
@@ -5,11 +5,13 @@ Mirage deception and SDN-based network control.
 Also exposes utility helpers used by the Responder agent and its tests.
 """
 
-import ipaddress
+import functools
 import logging
 import os
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+import socket
+from typing import IO, Any, Dict, List, Optional, Set, Tuple
+
+from ..utils.timefmt import now_iso as _now_iso
 
 logger = logging.getLogger(__name__)
 
@@ -18,17 +20,120 @@ logger = logging.getLogger(__name__)
 # IP-file helpers
 # ---------------------------------------------------------------------------
 
-def load_blocked_ips(filepath: str) -> Set[str]:
+# The blocked-IP file is an append-only journal: a bare ``<ip>`` line blocks,
+# a ``-<ip>`` tombstone unblocks, and the last entry for an IP wins.  Plain
+# one-IP-per-line files are therefore valid journals.  The Responder writes
+# through save_blocked_ip / remove_blocked_ip.  The file is compacted back to
+# one line per blocked IP once it holds more than _COMPACT_RATIO entries per
+# live IP.
+_COMPACT_RATIO     = 2
+_COMPACT_MIN_LINES = 64
+
+# filepath -> ((st_mtime_ns, st_size), ips, journal_lines).  The file is only
+# re-read when its stat key changes, e.g. after another process appends to it.
+_ip_cache: Dict[str, Tuple[Tuple[int, int], Set[str], int]] = {}
+
+
+def _stat_key(filepath: str) -> Optional[Tuple[int, int]]:
+    """Return ``(st_mtime_ns, st_size)`` for *filepath*, or None if missing."""
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cached_journal(filepath: str) -> Tuple[Set[str], int]:
     """
-    Load the set of blocked IPs from *filepath*.
+    Return ``(blocked_ips, journal_lines)`` for *filepath*, reloading on change.
 
-    Returns an empty set when the file does not exist or is empty.
+    The returned set is the cache entry itself — callers must not mutate it
+    without re-storing it via ``_ip_cache``.
     """
+    key = _stat_key(filepath)
+    if key is None:
+        _ip_cache.pop(filepath, None)
+        return set(), 0
+    cached = _ip_cache.get(filepath)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
     try:
-        with open(filepath, "r") as fh:
-            return {line.strip() for line in fh if line.strip()}
+        with open(filepath, "rb") as fh:
+            text = fh.read().decode("utf-8")
     except FileNotFoundError:
-        return set()
+        _ip_cache.pop(filepath, None)
+        return set(), 0
+    ips, n_lines = _replay_journal(text)
+    _ip_cache[filepath] = (key, ips, n_lines)
+    return ips, n_lines
+
+
+def _replay_journal(text: str) -> Tuple[Set[str], int]:
+    """Return ``(blocked_ips, journal_lines)`` for journal contents *text*."""
+    # One bulk split instead of a Python-level strip() per line
+    entries = text.split()
+    if "-" in text:
+        ips: Set[str] = set()
+        for entry in entries:
+            if entry[0] == "-":
+                ips.discard(entry[1:])
+            else:
+                ips.add(entry)
+    else:
+        ips = set(entries)          # plain list: no replay needed
+    return ips, len(entries)
+
+
+def _append_entry(filepath: str, line: str, ips: Set[str], n_lines: int) -> None:
+    """
+    Append one journal *line*, refresh the cache and compact if bloated.
+
+    *ips* is the cached set; it is only updated once the write has
+    succeeded, so a failed append leaves the cache matching the file.
+    """
+    with open(filepath, "a") as fh:
+        fh.write(f"{line}\n")
+    if line[0] == "-":
+        ips.discard(line[1:])
+    else:
+        ips.add(line)
+    n_lines += 1
+    if n_lines > max(_COMPACT_MIN_LINES, _COMPACT_RATIO * len(ips)):
+        _compact(filepath, ips)
+        n_lines = len(ips)
+    _ip_cache[filepath] = (_stat_key(filepath), ips, n_lines)
+
+
+def _compact(filepath: str, ips: Set[str]) -> None:
+    """Atomically rewrite *filepath* as one line per currently blocked IP."""
+    tmp_path = f"{filepath}.compact"
+    with open(tmp_path, "w") as fh:
+        fh.writelines(f"{entry}\n" for entry in sorted(ips))
+    os.replace(tmp_path, filepath)
+
+
+def load_blocked_ips(filepath: str) -> Set[str]:
+    """
+    Load the set of blocked IPs from *filepath*.
+
+    Returns an empty set when the file does not exist or is empty.  The
+    parsed set is cached per path and only re-read when the file's
+    mtime/size change; callers get their own copy.
+    """
+    return set(_cached_journal(filepath)[0])
+
+
+def load_blocked_ips_from_stream(stream: IO) -> Set[str]:
+    """
+    Load the set of blocked IPs from an open text or binary *stream*.
+
+    Same journal format as :func:`load_blocked_ips`, without the per-path
+    cache — useful for in-memory sources such as ``io.StringIO``.
+    """
+    text = stream.read()
+    if isinstance(text, bytes):
+        text = text.decode("utf-8")
+    return _replay_journal(text)[0]
 
 
 def save_blocked_ip(ip: str, filepath: str) -> bool:
@@ -39,30 +144,25 @@ def save_blocked_ip(ip: str, filepath: str) -> bool:
         True  – IP was added.
         False – IP was already present (no duplicate written).
     """
-    existing = load_blocked_ips(filepath)
+    existing, n_lines = _cached_journal(filepath)
     if ip in existing:
         return False
-    with open(filepath, "a") as fh:
-        fh.write(f"{ip}\n")
+    _append_entry(filepath, ip, existing, n_lines)
     return True
 
 
 def remove_blocked_ip(ip: str, filepath: str) -> bool:
     """
-    Remove *ip* from *filepath*.
+    Remove *ip* from *filepath* by appending a ``-<ip>`` tombstone.
 
     Returns:
         True  – IP was found and removed.
         False – IP was not present in the file.
     """
-    existing = load_blocked_ips(filepath)
+    existing, n_lines = _cached_journal(filepath)
     if ip not in existing:
         return False
-    existing.discard(ip)
-    # Rewrite the file with the remaining IPs
-    with open(filepath, "w") as fh:
-        for entry in sorted(existing):
-            fh.write(f"{entry}\n")
+    _append_entry(filepath, f"-{ip}", existing, n_lines)
     return True
 
 
@@ -75,13 +175,23 @@ def is_valid_ip(address: str) -> bool:
     Return True if *address* is a valid IPv4 address, False otherwise.
 
     Explicitly rejects IPv6 addresses, empty strings, and malformed strings.
+    Uses ``inet_pton`` (strict dotted-quad, no leading zeros — the same rules
+    as ``ipaddress.IPv4Address``) rather than the much slower pure-Python
+    parser; ``inet_aton`` is deliberately avoided as it accepts shorthand
+    forms like ``"1.2"``.  Results are memoised per string, since the
+    same attacker IPs are validated on every verdict.
     """
-    if not address:
+    if not address or not isinstance(address, str):
         return False
+    return _is_ipv4(address)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_ipv4(address: str) -> bool:
     try:
-        ipaddress.IPv4Address(address)
+        socket.inet_pton(socket.AF_INET, address)
         return True
-    except (ipaddress.AddressValueError, ValueError):
+    except (OSError, ValueError):
         return False
 
 
@@ -106,7 +216,7 @@ def format_action_log_entry(
         success      – bool indicating whether the action succeeded
     """
     return {
-        "timestamp":    datetime.now(timezone.utc).isoformat(),
+        "timestamp":    _now_iso(),
         "attacker_ip":  ip,
         "action_taken": action,
         "requested_by": requester,
@@ -15,6 +15,9 @@ Usage
     clf = get_classifier()
     if clf.available:
         label, confidence, is_attack = clf.predict(stats_dict)
+
+Long-running services can call ``preload()`` at startup to load the model
+in the background before the first prediction.
 """
 
 from __future__ import annotations
@@ -23,7 +26,7 @@ import logging
 import os
 import threading
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +36,10 @@ logger = logging.getLogger(__name__)
 _HERE       = Path(__file__).parent               # utils/
 _MODEL_PATH = _HERE.parent / "model" / "cic_multiclass_model.pkl"
 
+# Long-running entry points call preload() so the first prediction does not
+# pay the joblib.load cost.  Set CIC_ML_PRELOAD=false to load on first use.
+_PRELOAD = os.environ.get("CIC_ML_PRELOAD", "true").lower() != "false"
+
 # ---------------------------------------------------------------------------
 # Labels that should trigger a block action
 # (everything except BENIGN is treated as hostile)
@@ -55,107 +62,199 @@ CIC_BLOCK_LABELS: frozenset[str] = frozenset({
 })
 
 # ---------------------------------------------------------------------------
-# Feature mapping:  CIC column name  →  Scout stats key  (or constant 0)
+# Feature mapping:  CIC column name  →  derived Scout quantity
 #
 # Scout stats keys available per _compute_stats():
 #   packets_per_second, bytes_per_second, unique_dest_ips,
 #   syn_count, port_entropy, window_seconds
 #
-# We convert window_seconds → microseconds for Flow Duration.
-# Everything else defaults to 0 — the model degrades gracefully.
+# Every CIC column we can fill is one of nine quantities derived from
+# (pps, bps, syns, window); window_seconds → microseconds for Flow Duration.
+# Columns not listed here are constant 0 — the model degrades gracefully.
+# At load time the model's column order is resolved into two parallel index
+# arrays (target column, source quantity) so filling a row is one small
+# numeric kernel — compiled with Numba when it is installed.
 # ---------------------------------------------------------------------------
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+(_D_FLOW_US, _D_TOTAL_PKTS, _D_TOTAL_BYTES, _D_MEAN_PKT_LEN, _D_MEAN_IAT_US,
+ _D_FWD_HEADER_LEN, _D_BPS, _D_PPS, _D_SYNS) = range(9)
+
+_FEATURE_SOURCES: Dict[str, int] = {
+    "Flow Duration":               _D_FLOW_US,
+    "Total Fwd Packets":           _D_TOTAL_PKTS,
+    "Total Length of Fwd Packets": _D_TOTAL_BYTES,
+    "Fwd Packet Length Max":       _D_MEAN_PKT_LEN,
+    "Fwd Packet Length Mean":      _D_MEAN_PKT_LEN,
+    "Flow Bytes/s":                _D_BPS,
+    "Flow Packets/s":              _D_PPS,
+    "Flow IAT Mean":               _D_MEAN_IAT_US,
+    "Flow IAT Max":                _D_FLOW_US,
+    "Fwd IAT Total":               _D_FLOW_US,
+    "Fwd IAT Mean":                _D_MEAN_IAT_US,
+    "Fwd IAT Max":                 _D_FLOW_US,
+    "Fwd Header Length":           _D_FWD_HEADER_LEN,
+    "Fwd Packets/s":               _D_PPS,
+    "Max Packet Length":           _D_MEAN_PKT_LEN,
+    "Packet Length Mean":          _D_MEAN_PKT_LEN,
+    "SYN Flag Count":              _D_SYNS,
+    "Average Packet Size":         _D_MEAN_PKT_LEN,
+    "Avg Fwd Segment Size":        _D_MEAN_PKT_LEN,
+    "Fwd Header Length.1":         _D_FWD_HEADER_LEN,
+    "Subflow Fwd Packets":         _D_TOTAL_PKTS,
+    "Subflow Fwd Bytes":           _D_TOTAL_BYTES,
+    "act_data_pkt_fwd":            _D_TOTAL_PKTS,
+    "Idle Mean":                   _D_FLOW_US,
+    "Idle Max":                    _D_FLOW_US,
+}
+
+
+def _derived_quantities(pps: float, bps: float, syns: float, window: float) -> tuple:
+    """The nine values indexed by the ``_D_*`` constants."""
+    flow_us = window * 1_000_000                                 # μs
+    pkts    = pps * window           # approximate total fwd packet count
+    nbytes  = bps * window           # approximate total fwd bytes
+    denom   = max(pkts, 1.0)
+    return (
+        flow_us,
+        pkts,
+        nbytes,
+        nbytes / denom,              # mean packet length
+        flow_us / denom,             # mean inter-arrival time, μs
+        pkts * 20,                   # assume 20-byte IP header
+        bps,
+        pps,
+        syns,
+    )
+
+
+def _fill_features(pps, bps, syns, window, cols, srcs, out) -> None:
+    """Write derived quantity ``srcs[k]`` into ``out[cols[k]]`` for each k."""
+    d = _derived_quantities(pps, bps, syns, window)
+    for c, s in zip(cols, srcs):
+        out[c] = d[s]
+
+
+if _NUMBA_AVAILABLE:
+    _derived_quantities_nb = njit(cache=True)(_derived_quantities)
+
+    @njit(cache=True)
+    def _fill_features_nb(pps, bps, syns, window, cols, srcs, out):  # pragma: no cover
+        d = _derived_quantities_nb(pps, bps, syns, window)
+        for k in range(cols.shape[0]):
+            out[cols[k]] = d[srcs[k]]
+
+
+_NUMBA_KERNEL_READY: Optional[bool] = None
+
+
+def _numba_kernel_ready() -> bool:
+    """
+    Whether ``_fill_features_nb`` can be used.
+
+    The first call compiles the kernel (or loads it from Numba's on-disk
+    cache) with the argument types ``_fill_row`` passes.  If that fails,
+    the failure is logged once and rows are filled by ``_fill_features``.
+    """
+    global _NUMBA_KERNEL_READY
+    if _NUMBA_KERNEL_READY is None:
+        _NUMBA_KERNEL_READY = False
+        if _NUMBA_AVAILABLE:
+            try:
+                import numpy as np  # noqa: PLC0415
+                slots = np.zeros(1, dtype=np.intp)
+                _fill_features_nb(1.0, 1.0, 1.0, 1.0, slots, slots,
+                                  np.zeros(1, dtype=np.float32))
+                _NUMBA_KERNEL_READY = True
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("[CIC-ML] Numba feature kernel unavailable, using Python: %s", exc)
+    return _NUMBA_KERNEL_READY
+
+
+def _feature_slots(model_feature_names: list) -> Tuple[List[int], List[int]]:
+    """(column indices, ``_D_*`` sources) for the model's non-zero columns."""
+    cols: List[int] = []
+    srcs: List[int] = []
+    for i, name in enumerate(model_feature_names):
+        src = _FEATURE_SOURCES.get(str(name))
+        if src is not None:
+            cols.append(i)
+            srcs.append(src)
+    return cols, srcs
+
+
+def _stats_inputs(stats: dict) -> Tuple[float, float, float, float]:
+    """Pull the four Scout stats every feature is derived from."""
+    return (
+        float(stats.get("packets_per_second", 0.0)),
+        float(stats.get("bytes_per_second",   0.0)),
+        float(stats.get("syn_count",          0)),
+        float(stats.get("window_seconds",     10)),
+    )
+
+
 def _build_feature_vector(stats: dict, model_feature_names: list) -> list:
     """Map scout stats dict → ordered feature vector for the CIC model."""
+    vec = [0.0] * len(model_feature_names)
+    _fill_features(*_stats_inputs(stats), *_feature_slots(model_feature_names), vec)
+    return vec
 
-    pps    = float(stats.get("packets_per_second", 0.0))
-    bps    = float(stats.get("bytes_per_second",   0.0))
-    syns   = float(stats.get("syn_count",          0))
-    window = float(stats.get("window_seconds",     10))
-    total_pkts = pps * window          # approximate total fwd packet count
-    total_bytes = bps * window         # approximate total fwd bytes
-
-    _SCOUT_MAP: dict[str, float] = {
-        "Destination Port":           0.0,
-        "Flow Duration":              window * 1_000_000,   # μs
-        "Total Fwd Packets":          total_pkts,
-        "Total Backward Packets":     0.0,
-        "Total Length of Fwd Packets": total_bytes,
-        "Total Length of Bwd Packets": 0.0,
-        "Fwd Packet Length Max":      total_bytes / max(total_pkts, 1),
-        "Fwd Packet Length Min":      0.0,
-        "Fwd Packet Length Mean":     total_bytes / max(total_pkts, 1),
-        "Fwd Packet Length Std":      0.0,
-        "Bwd Packet Length Max":      0.0,
-        "Bwd Packet Length Min":      0.0,
-        "Bwd Packet Length Mean":     0.0,
-        "Bwd Packet Length Std":      0.0,
-        "Flow Bytes/s":               bps,
-        "Flow Packets/s":             pps,
-        "Flow IAT Mean":              (window * 1_000_000) / max(total_pkts, 1),
-        "Flow IAT Std":               0.0,
-        "Flow IAT Max":               window * 1_000_000,
-        "Flow IAT Min":               0.0,
-        "Fwd IAT Total":              window * 1_000_000,
-        "Fwd IAT Mean":               (window * 1_000_000) / max(total_pkts, 1),
-        "Fwd IAT Std":                0.0,
-        "Fwd IAT Max":                window * 1_000_000,
-        "Fwd IAT Min":                0.0,
-        "Bwd IAT Total":              0.0,
-        "Bwd IAT Mean":               0.0,
-        "Bwd IAT Std":                0.0,
-        "Bwd IAT Max":                0.0,
-        "Bwd IAT Min":                0.0,
-        "Fwd PSH Flags":              0.0,
-        "Bwd PSH Flags":              0.0,
-        "Fwd URG Flags":              0.0,
-        "Bwd URG Flags":              0.0,
-        "Fwd Header Length":          total_pkts * 20,  # assume 20-byte IP header
-        "Bwd Header Length":          0.0,
-        "Fwd Packets/s":              pps,
-        "Bwd Packets/s":              0.0,
-        "Min Packet Length":          0.0,
-        "Max Packet Length":          total_bytes / max(total_pkts, 1),
-        "Packet Length Mean":         total_bytes / max(total_pkts, 1),
-        "Packet Length Std":          0.0,
-        "Packet Length Variance":     0.0,
-        "FIN Flag Count":             0.0,
-        "SYN Flag Count":             syns,
-        "RST Flag Count":             0.0,
-        "PSH Flag Count":             0.0,
-        "ACK Flag Count":             0.0,
-        "URG Flag Count":             0.0,
-        "CWE Flag Count":             0.0,
-        "ECE Flag Count":             0.0,
-        "Down/Up Ratio":              0.0,
-        "Average Packet Size":        total_bytes / max(total_pkts, 1),
-        "Avg Fwd Segment Size":       total_bytes / max(total_pkts, 1),
-        "Avg Bwd Segment Size":       0.0,
-        "Fwd Header Length.1":        total_pkts * 20,
-        "Fwd Avg Bytes/Bulk":         0.0,
-        "Fwd Avg Packets/Bulk":       0.0,
-        "Fwd Avg Bulk Rate":          0.0,
-        "Bwd Avg Bytes/Bulk":         0.0,
-        "Bwd Avg Packets/Bulk":       0.0,
-        "Bwd Avg Bulk Rate":          0.0,
-        "Subflow Fwd Packets":        total_pkts,
-        "Subflow Fwd Bytes":          total_bytes,
-        "Subflow Bwd Packets":        0.0,
-        "Subflow Bwd Bytes":          0.0,
-        "Init_Win_bytes_forward":     0.0,
-        "Init_Win_bytes_backward":    0.0,
-        "act_data_pkt_fwd":           total_pkts,
-        "min_seg_size_forward":       0.0,
-        "Active Mean":                0.0,
-        "Active Std":                 0.0,
-        "Active Max":                 0.0,
-        "Active Min":                 0.0,
-        "Idle Mean":                  window * 1_000_000,
-        "Idle Std":                   0.0,
-        "Idle Max":                   window * 1_000_000,
-        "Idle Min":                   0.0,
-    }
-
-    return [_SCOUT_MAP.get(str(f), 0.0) for f in model_feature_names]
+
+def _prefetch_file(path: Path) -> None:
+    """Ask the kernel to start reading *path* into the page cache (best effort)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def _label_tables(encoder) -> Tuple[List[str], frozenset]:
+    """
+    Precompute per-class-id labels and the set of ids to block.
+
+    Labels are normalised (Unicode replacement char → ``-``); an id blocks
+    if either its raw or normalised label is in CIC_BLOCK_LABELS.
+    """
+    if encoder is None:
+        return [], frozenset()
+    raw    = [str(c) for c in encoder.classes_]
+    labels = [c.replace("\ufffd", "-") for c in raw]
+    block_idx = frozenset(
+        i for i, (r, c) in enumerate(zip(raw, labels))
+        if c in CIC_BLOCK_LABELS or r in CIC_BLOCK_LABELS
+    )
+    return labels, block_idx
+
+
+def _inplace_booster(model) -> Tuple[Optional[object], Tuple[int, int]]:
+    """
+    Return ``(booster, iteration_range)`` for calling ``inplace_predict``
+    directly, or ``(None, (0, 0))`` when *model* is not a multi:softprob
+    XGBoost classifier (then ``predict_proba`` is used instead).
+    """
+    get_booster = getattr(model, "get_booster", None)
+    if get_booster is None or getattr(model, "objective", None) != "multi:softprob":
+        return None, (0, 0)
+    try:
+        booster = get_booster()
+    except Exception:  # noqa: BLE001 — unfitted / foreign model
+        return None, (0, 0)
+    # Mirror XGBClassifier.predict_proba: honour early stopping if it was used
+    try:
+        iteration_range = (0, int(model.best_iteration) + 1)
+    except AttributeError:
+        iteration_range = (0, 0)
+    return booster, iteration_range
 
 
 # ---------------------------------------------------------------------------
@@ -178,7 +277,18 @@ class CICClassifier:
         self._loaded  = False
         self._model   = None
         self._encoder = None
+        self._booster = None
+        self._labels: List[str] = []
+        self._block_idx: frozenset = frozenset()
+        self._iteration_range: Tuple[int, int] = (0, 0)
         self._feature_names: list = []
+        # Non-zero columns and the _D_* quantity each one takes
+        self._slot_cols: List[int] = []
+        self._slot_srcs: List[int] = []
+        # Row filler: _fill_features_nb once it has compiled, else _fill_features
+        self._fill = _fill_features
+        # Per-thread (1, n_features) float32 input row, reused across predicts
+        self._scratch_tls = threading.local()
         self.available = False
 
     # ------------------------------------------------------------------
@@ -196,6 +306,7 @@ class CICClassifier:
                     )
                     self._loaded = True
                     return
+                _prefetch_file(self._path)
                 obj = joblib.load(self._path)
                 # Stored as (XGBClassifier, LabelEncoder)
                 if isinstance(obj, (tuple, list)) and len(obj) == 2:
@@ -207,6 +318,14 @@ class CICClassifier:
                     self._model = obj
                 if self._model is not None and hasattr(self._model, "feature_names_in_"):
                     self._feature_names = list(self._model.feature_names_in_)
+                self._slot_cols, self._slot_srcs = _feature_slots(self._feature_names)
+                if _numba_kernel_ready():
+                    import numpy as np  # noqa: PLC0415
+                    self._slot_cols = np.asarray(self._slot_cols, dtype=np.intp)
+                    self._slot_srcs = np.asarray(self._slot_srcs, dtype=np.intp)
+                    self._fill      = _fill_features_nb
+                self._booster, self._iteration_range = _inplace_booster(self._model)
+                self._labels, self._block_idx = _label_tables(self._encoder)
                 self.available = self._model is not None
                 if self.available:
                     n_classes = (
@@ -229,6 +348,22 @@ class CICClassifier:
             self._load()
         return self
 
+    # ------------------------------------------------------------------
+    def _scratch_row(self):
+        """
+        Return this thread's reusable model input row.
+
+        Zero-valued columns are written once at allocation and never
+        touched again; predict() only overwrites the ``_slot_cols``.
+        float32 is what XGBoost converts to internally anyway.
+        """
+        row = getattr(self._scratch_tls, "row", None)
+        if row is None:
+            import numpy as np  # noqa: PLC0415
+            row = np.zeros((1, len(self._feature_names)), dtype=np.float32)
+            self._scratch_tls.row = row
+        return row
+
     # ------------------------------------------------------------------
     def predict(self, stats: dict) -> Tuple[Optional[str], float, bool]:
         """
@@ -254,27 +389,64 @@ class CICClassifier:
             return None, 0.0, False
 
         try:
-            import numpy as np  # noqa: PLC0415
-
-            vec  = _build_feature_vector(stats, self._feature_names)
-            arr  = np.array([vec], dtype=float)
-            proba = self._model.predict_proba(arr)[0]   # shape: (n_classes,)
-            idx  = int(proba.argmax())
-            conf = float(proba[idx])
+            arr = self._scratch_row()
+            self._fill_row(arr[0], stats)
+            return self._decode(self._predict_proba(arr)[0])
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("[CIC-ML] predict error: %s", exc)
+            return None, 0.0, False
 
-            if self._encoder is not None:
-                label = str(self._encoder.inverse_transform([idx])[0])
-            else:
-                label = str(idx)
+    # ------------------------------------------------------------------
+    def predict_batch(self, stats_list: List[dict]) -> List[Tuple[Optional[str], float, bool]]:
+        """
+        Classify several Scout stats dicts with a single model call.
 
-            # Normalise labels: replace Unicode replacement char with dash
-            label_clean = label.replace("\ufffd", "-")
-            is_attack   = label_clean in CIC_BLOCK_LABELS or label in CIC_BLOCK_LABELS
-            return label_clean, conf, is_attack
+        Returns one ``(label, confidence, is_attack)`` tuple per input, in
+        order — the same values :meth:`predict` would give for each.
+        """
+        if not self._loaded:
+            self._load()
+        if not self.available or not stats_list:
+            return [(None, 0.0, False)] * len(stats_list)
 
+        try:
+            import numpy as np  # noqa: PLC0415
+            arr = np.zeros((len(stats_list), len(self._feature_names)), dtype=np.float32)
+            for row, stats in zip(arr, stats_list):
+                self._fill_row(row, stats)
+            return [self._decode(p) for p in self._predict_proba(arr)]
         except Exception as exc:  # noqa: BLE001
-            logger.debug("[CIC-ML] predict error: %s", exc)
-            return None, 0.0, False
+            logger.debug("[CIC-ML] predict_batch error: %s", exc)
+            return [(None, 0.0, False)] * len(stats_list)
+
+    # ------------------------------------------------------------------
+    def _fill_row(self, row, stats: dict) -> None:
+        """Write the non-zero features for *stats* into input *row*."""
+        pps, bps, syns, window = _stats_inputs(stats)
+        self._fill(pps, bps, syns, window, self._slot_cols, self._slot_srcs, row)
+
+    def _predict_proba(self, arr):
+        """Class probabilities for each row of *arr*: shape (n_rows, n_classes)."""
+        if self._booster is not None:
+            # Straight to the booster: skips the sklearn wrapper's
+            # validation and per-call DMatrix construction.
+            return self._booster.inplace_predict(
+                arr, iteration_range=self._iteration_range,
+            )
+        return self._model.predict_proba(arr)
+
+    def _decode(self, proba) -> Tuple[Optional[str], float, bool]:
+        """Turn one probability row into ``(label, confidence, is_attack)``."""
+        idx  = int(proba.argmax())
+        conf = float(proba[idx])
+
+        if self._encoder is not None:
+            # Class id → normalised label / block decision, both
+            # precomputed at load time (IndexError → caught by caller)
+            return self._labels[idx], conf, idx in self._block_idx
+
+        label = str(idx)
+        return label, conf, label in CIC_BLOCK_LABELS
 
 
 # ---------------------------------------------------------------------------
@@ -292,3 +464,21 @@ def get_classifier() -> CICClassifier:
             if _instance is None:
                 _instance = CICClassifier()
     return _instance
+
+
+def preload() -> None:
+    """
+    Start loading the singleton's model on a daemon thread.
+
+    Not run at import: importing this module must not start a thread that
+    unpickles XGBoost (a concurrent ``import xgboost`` can then see a
+    partially initialised module).  No-op when ``CIC_ML_PRELOAD=false`` or
+    the model file is missing.
+    """
+    if not _PRELOAD or not _MODEL_PATH.exists():
+        return
+    threading.Thread(
+        target=lambda: get_classifier().ensure_loaded(),
+        name="cic-ml-preload",
+        daemon=True,
+    ).start()
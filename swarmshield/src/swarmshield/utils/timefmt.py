@@ -0,0 +1,62 @@
+"""
+SwarmShield timestamp helpers
+=============================
+ISO-8601 UTC timestamps for log entries and event records.
+
+The ``YYYY-MM-DDTHH:MM:SS`` prefix only changes once a wall-clock second,
+so it is formatted once per second and cached; each call just appends the
+microsecond suffix.
+
+Usage::
+
+    from swarmshield.utils.timefmt import now_iso, now_iso_seconds, iso_from_ns
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from typing import Tuple
+
+__all__ = ["iso_from_ns", "now_iso", "now_iso_seconds"]
+
+_iso_second_cache: Tuple[int, str] = (-1, "")   # (unix second, formatted prefix)
+
+
+def _second_prefix(s: int) -> str:
+    """``YYYY-MM-DDTHH:MM:SS`` for unix second *s*, formatted once per second."""
+    global _iso_second_cache
+    sec, prefix = _iso_second_cache
+    if s != sec:
+        prefix = datetime.fromtimestamp(s, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _iso_second_cache = (s, prefix)    # single tuple swap: thread-safe
+    return prefix
+
+
+def iso_from_ns(ns: int) -> str:
+    """
+    Format a ``time.time_ns()`` value as an ISO-8601 UTC string.
+
+    Parameters
+    ----------
+    ns : int
+        Nanoseconds since the Unix epoch.
+
+    Returns
+    -------
+    str
+        e.g. ``"2026-01-01T00:00:00.000000+00:00"`` (microsecond precision,
+        same format as ``datetime.isoformat()`` on an aware UTC datetime).
+    """
+    prefix = _second_prefix(ns // 1_000_000_000)
+    return f"{prefix}.{(ns % 1_000_000_000) // 1000:06d}+00:00"
+
+
+def now_iso() -> str:
+    """Return the current UTC time as an ISO-8601 string."""
+    return iso_from_ns(time.time_ns())
+
+
+def now_iso_seconds() -> str:
+    """Return the current UTC time as ``YYYY-MM-DDTHH:MM:SSZ`` (one-second resolution)."""
+    return f"{_second_prefix(time.time_ns() // 1_000_000_000)}Z"
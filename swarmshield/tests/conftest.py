@@ -0,0 +1,66 @@
+"""
+Shared pytest fixtures for the SwarmShield test suite.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    """
+    Flask test client for the Responder app, shared by a test module.
+
+    The Responder's runtime files are redirected to a per-module temp
+    directory, so tests neither touch swarmshield/runtime/ nor collide
+    when run in parallel (``pytest -n auto``).
+    """
+    from src.swarmshield.agents import responder
+
+    runtime = tmp_path_factory.mktemp("responder-runtime")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(responder, "BLOCKED_IPS_FILE", str(runtime / "blocked_ips.txt"))
+        mp.setattr(responder, "ACTIONS_LOG_FILE", str(runtime / "responder_actions.log"))
+        responder.app.config["TESTING"] = True
+        # One client context for the whole module rather than per request
+        with responder.app.test_client() as test_client:
+            yield test_client
+
+
+@pytest.fixture(scope="module")
+def responder_mocks():
+    """
+    Patch the Responder's iptables calls and coordinator reports once per module.
+
+    Yields ``(mock_subprocess_run, mock_requests_post)`` preconfigured for
+    success; tests call ``reset_mock()`` before asserting on call counts.
+    """
+    with patch("src.swarmshield.agents.responder.subprocess.run") as mock_subprocess, \
+         patch("src.swarmshield.agents.responder.requests.post") as mock_requests_post:
+        mock_subprocess.return_value    = MagicMock(returncode=0, stderr="")
+        mock_requests_post.return_value = MagicMock(status_code=200)
+        yield mock_subprocess, mock_requests_post
+
+
+@pytest.fixture(scope="module")
+def wsgi_post(client):
+    """
+    Return ``post(path, body) -> Response`` that calls the Responder's WSGI app directly.
+
+    The environ comes straight from EnvironBuilder, bypassing FlaskClient's
+    cookie jar and context preservation — for the high-volume scenario
+    tests.  Depends on ``client`` for its runtime-file redirection.
+    """
+    from werkzeug.test import EnvironBuilder
+    from werkzeug.wrappers import Response
+
+    wsgi_app = client.application.wsgi_app
+
+    def post(path: str, body: bytes) -> Response:
+        environ = EnvironBuilder(
+            path=path, method="POST", data=body, content_type="application/json",
+        ).get_environ()
+        return Response.from_app(wsgi_app, environ)
+
+    return post
@@ -15,6 +15,7 @@ Usage (from swarmshield/ directory):
     .venv/bin/python tests/run_responder_agent.py
 """
 
+import asyncio
 import json
 import os
 import sys
@@ -198,7 +199,7 @@ try:
     resp = client.get("/health")
     check("GET /health → HTTP 200", resp.status_code == 200, f"got {resp.status_code}")
 
-    body = json.loads(resp.data)
+    body = resp.get_json()
     check("body has status == 'alive'",      body.get("status")   == "alive",       str(body))
     check("body has agent_id == 'responder-1'", body.get("agent_id") == "responder-1", str(body))
 
@@ -209,6 +210,41 @@ except Exception as exc:
 
 # ---- /verdict scenarios -----------------------------------------------------
 
+# letter, source_ip, attack type, confidence, SHAP explanation, action, iptables called?
+VERDICT_SCENARIOS = [
+    ("A", "203.0.113.42", "DDoS",       0.97, "High packet rate from single source", "block",                True),
+    ("B", "198.51.100.7", "PortScan",   0.88, "Sequential port probing detected",    "redirect_to_honeypot", True),
+    ("C", "10.10.10.10",  "Normal",     0.55, "Baseline traffic",                    "monitor",              False),
+    ("D", "172.16.0.77",  "Ransomware", 0.91, "Encrypted file patterns detected",    "quarantine",           True),
+]
+VERDICT_TEMPLATE = {"agent_id": "analyzer-1"}
+
+
+def _post_verdict(scenario: tuple) -> tuple:
+    """POST one scenario's verdict; return ``(status_code, json_body)``."""
+    _letter, ip, attack, conf, explanation, action, _expect_sub = scenario
+    payload = {
+        **VERDICT_TEMPLATE,
+        "source_ip":             ip,
+        "predicted_attack_type": attack,
+        "confidence":            conf,
+        "shap_explanation":      explanation,
+        "recommended_action":    action,
+    }
+    # FlaskClient is not thread-safe, so each worker gets its own
+    r = responder_app.test_client().post(
+        "/verdict", data=json.dumps(payload), content_type="application/json",
+    )
+    return r.status_code, r.get_json()
+
+
+async def _post_verdicts_concurrently(scenarios: list) -> list:
+    """Run _post_verdict for every scenario on the default executor at once."""
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        *(loop.run_in_executor(None, _post_verdict, s) for s in scenarios)
+    )
+
 print(f"\n{BOLD}{'='*60}{RESET}")
 print(f"{BOLD}  Section 4 — Flask /verdict endpoint{RESET}")
 print(f"{BOLD}{'='*60}{RESET}")
@@ -221,90 +257,26 @@ if _flask_ok:
         mock_sub.return_value = MagicMock(returncode=0, stderr="")
         mock_req.return_value = MagicMock(status_code=200)
 
-        # --- DDoS / block ------------------------------------------------
-        print(f"\n  {CYAN}Scenario A — DDoS + block{RESET}")
-        payload_ddos = {
-            "source_ip":             "203.0.113.42",
-            "predicted_attack_type": "DDoS",
-            "confidence":            0.97,
-            "shap_explanation":      "High packet rate from single source",
-            "recommended_action":    "block",
-            "agent_id":              "analyzer-1",
-        }
-        r = client.post("/verdict", data=json.dumps(payload_ddos),
-                        content_type="application/json")
-        b = json.loads(r.data)
-        check("DDoS → HTTP 200",            r.status_code == 200, f"got {r.status_code}")
-        check("DDoS → action_taken = block", b.get("action_taken") == "block", str(b))
-        check("DDoS → status = ok",          b.get("status") == "ok")
-        check("DDoS → success = True",       b.get("success") is True)
-        check("DDoS → subprocess.run called (iptables)", mock_sub.call_count >= 1,
-              f"called {mock_sub.call_count} time(s)")
-        print(f"          {INFO}  response: {b}")
-
-        mock_sub.reset_mock()
-
-        # --- PortScan / redirect ------------------------------------------
-        print(f"\n  {CYAN}Scenario B — PortScan + redirect_to_honeypot{RESET}")
-        payload_scan = {
-            "source_ip":             "198.51.100.7",
-            "predicted_attack_type": "PortScan",
-            "confidence":            0.88,
-            "shap_explanation":      "Sequential port probing detected",
-            "recommended_action":    "redirect_to_honeypot",
-            "agent_id":              "analyzer-1",
-        }
-        r = client.post("/verdict", data=json.dumps(payload_scan),
-                        content_type="application/json")
-        b = json.loads(r.data)
-        check("PortScan → HTTP 200",                    r.status_code == 200, f"got {r.status_code}")
-        check("PortScan → action_taken = redirect_to_honeypot",
-              b.get("action_taken") == "redirect_to_honeypot", str(b))
-        check("PortScan → subprocess.run called (DNAT rule)", mock_sub.call_count >= 1,
-              f"called {mock_sub.call_count} time(s)")
-        print(f"          {INFO}  response: {b}")
-
-        mock_sub.reset_mock()
-
-        # --- Normal / monitor (no subprocess) ----------------------------
-        print(f"\n  {CYAN}Scenario C — Normal + monitor{RESET}")
-        payload_norm = {
-            "source_ip":             "10.10.10.10",
-            "predicted_attack_type": "Normal",
-            "confidence":            0.55,
-            "shap_explanation":      "Baseline traffic",
-            "recommended_action":    "monitor",
-            "agent_id":              "analyzer-1",
-        }
-        r = client.post("/verdict", data=json.dumps(payload_norm),
-                        content_type="application/json")
-        b = json.loads(r.data)
-        check("Normal → HTTP 200",                   r.status_code == 200, f"got {r.status_code}")
-        check("Normal → action_taken = monitor",     b.get("action_taken") == "monitor", str(b))
-        check("Normal → subprocess.run NOT called",  mock_sub.call_count == 0,
-              f"called {mock_sub.call_count} time(s)")
-        print(f"          {INFO}  response: {b}")
-
-        mock_sub.reset_mock()
-
-        # --- Ransomware / quarantine -------------------------------------
-        print(f"\n  {CYAN}Scenario D — Ransomware + quarantine{RESET}")
-        payload_ransom = {
-            "source_ip":             "172.16.0.77",
-            "predicted_attack_type": "Ransomware",
-            "confidence":            0.91,
-            "shap_explanation":      "Encrypted file patterns detected",
-            "recommended_action":    "quarantine",
-            "agent_id":              "analyzer-1",
-        }
-        r = client.post("/verdict", data=json.dumps(payload_ransom),
-                        content_type="application/json")
-        b = json.loads(r.data)
-        check("Ransomware → HTTP 200",                   r.status_code == 200, f"got {r.status_code}")
-        check("Ransomware → action_taken = quarantine",  b.get("action_taken") == "quarantine", str(b))
-        check("Ransomware → subprocess.run called",      mock_sub.call_count >= 1,
-              f"called {mock_sub.call_count} time(s)")
-        print(f"          {INFO}  response: {b}")
+        # Post all scenarios concurrently, then report them in table order.
+        # Each scenario uses its own source IP, so iptables calls are
+        # attributed per scenario without resetting the shared mock.
+        replies = asyncio.run(_post_verdicts_concurrently(VERDICT_SCENARIOS))
+
+        for scenario, (status, b) in zip(VERDICT_SCENARIOS, replies):
+            letter, ip, attack, conf, explanation, action, expect_sub = scenario
+            print(f"\n  {CYAN}Scenario {letter} — {attack} + {action}{RESET}")
+            n_sub = sum(1 for c in mock_sub.call_args_list if ip in c.args[0])
+            check(f"{attack} → HTTP 200",                 status == 200, f"got {status}")
+            check(f"{attack} → action_taken = {action}",  b.get("action_taken") == action, str(b))
+            check(f"{attack} → status = ok",              b.get("status") == "ok")
+            check(f"{attack} → success = True",           b.get("success") is True)
+            if expect_sub:
+                check(f"{attack} → subprocess.run called (iptables)", n_sub >= 1,
+                      f"called {n_sub} time(s)")
+            else:
+                check(f"{attack} → subprocess.run NOT called",        n_sub == 0,
+                      f"called {n_sub} time(s)")
+            print(f"          {INFO}  response: {b}")
 
         mock_sub.reset_mock()
 
@@ -313,7 +285,7 @@ if _flask_ok:
         r = client.post("/verdict", data=json.dumps({"source_ip": "1.2.3.4"}),
                         content_type="application/json")
         check("Missing fields → HTTP 400", r.status_code == 400, f"got {r.status_code}")
-        b = json.loads(r.data)
+        b = r.get_json()
         check("error key present in response", "error" in b, str(b))
         print(f"          {INFO}  response: {b}")
 
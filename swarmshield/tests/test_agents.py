@@ -3,7 +3,9 @@ Unit tests for agents.
 """
 
 import pytest
+import numpy as np
 from src.swarmshield.agents import ScoutAgent, AnalyzerAgent, ResponderAgent, Mahoraga, EvolverAgent
+from src.swarmshield.agents.analyzer import _propagate_levels, _propagate_trials, _propagation_csr
 
 
 class TestScoutAgent:
@@ -41,6 +43,119 @@ class TestAnalyzerAgent:
         result = analyzer.model_threat_graph([])
         assert isinstance(result, dict)
 
+    @pytest.mark.parametrize("top_k", [0, -1])
+    def test_top_k_must_be_positive(self, top_k):
+        """top_k below 1 is rejected instead of emptying or truncating the ranking."""
+        with pytest.raises(ValueError):
+            AnalyzerAgent(top_k=top_k)
+
+    def test_top_k_one_keeps_most_confident_node(self):
+        """top_k=1 reports only the single most confident node."""
+        analyzer = AnalyzerAgent(top_k=1)
+        nodes = [
+            {"ip": "10.0.0.1", "threat_type": "DDoS",      "confidence": 0.4},
+            {"ip": "10.0.0.2", "threat_type": "Port Scan", "confidence": 0.9},
+        ]
+        assessment = analyzer.assess_risk({"nodes": nodes, "simulation_results": []})
+        assert [t["ip"] for t in assessment["top_threats"]] == ["10.0.0.2"]
+
+    def test_simulate_attack_certain_edges_reach_every_node(self):
+        """Weight >= 1 edges always propagate; isolated nodes never do."""
+        analyzer = AnalyzerAgent()
+        graph = {
+            "nodes": [
+                {"ip": "10.0.0.1", "confidence": 0.9},
+                {"ip": "10.0.0.2", "confidence": 0.9},
+                {"ip": "10.0.0.3", "confidence": 0.9},
+                {"ip": "10.0.0.4", "confidence": 0.0},
+            ],
+            "edges": [
+                {"src": "10.0.0.1", "dst": "10.0.0.2", "weight": 1.5},
+                {"src": "10.0.0.2", "dst": "10.0.0.3", "weight": 1.5},
+            ],
+        }
+        results = analyzer.simulate_attack(graph)
+        assert [r["trial"] for r in results] == list(range(1, len(results) + 1))
+        for r in results:
+            assert r["entry_node"] != "10.0.0.4"
+            assert r["nodes_reached"] == 3
+            assert r["compromised_ips"] == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+            # Two hops from an end, one from the middle, then one empty level
+            expected = 2 if r["entry_node"] == "10.0.0.2" else 3
+            assert r["path_length"] == expected
+
+    def test_per_trial_kernel_matches_level_semantics(self):
+        """The loop Numba compiles gives the same certain-edge outcome."""
+        ip_index = {"a": 0, "b": 1, "c": 2, "d": 3}
+        edges = [{"src": "a", "dst": "b", "weight": 1.5},
+                 {"src": "b", "dst": "c", "weight": 1.5}]
+        indptr, indices, weights = _propagation_csr(edges, ip_index, 4)
+        entry   = np.array([0, 1, 3])
+        visited = np.zeros((3, 4), dtype=bool)
+        reached = np.empty(3, dtype=np.intp)
+        steps   = np.empty(3, dtype=np.intp)
+        _propagate_trials(indptr, indices, weights, entry, 4, visited, reached, steps)
+        assert reached.tolist() == [3, 3, 1]
+        assert steps.tolist() == [3, 2, 1]
+        assert visited.tolist()[2] == [False, False, False, True]
+
+    def test_full_reach_still_counts_final_empty_level(self):
+        """Stopping once every node is reached keeps the full-BFS path_length."""
+        ip_index = {"a": 0, "b": 1, "c": 2}
+        edges = [{"src": "a", "dst": "b", "weight": 1.5},
+                 {"src": "b", "dst": "c", "weight": 1.5}]
+        indptr, indices, weights = _propagation_csr(edges, ip_index, 3)
+        entry = np.array([0, 1, 2])
+        for run in (
+            lambda *a: _propagate_trials(*a),
+            lambda *a: _propagate_levels(*a, np.random.default_rng(0)),
+        ):
+            visited = np.zeros((3, 3), dtype=bool)
+            reached = np.empty(3, dtype=np.intp)
+            steps   = np.empty(3, dtype=np.intp)
+            run(indptr, indices, weights, entry, 3, visited, reached, steps)
+            assert reached.tolist() == [3, 3, 3]
+            assert steps.tolist() == [3, 2, 3]
+
+    def test_single_node_graph_path_length(self):
+        results = AnalyzerAgent().simulate_attack(
+            {"nodes": [{"ip": "10.0.0.1", "confidence": 0.9}], "edges": []}
+        )
+        assert results
+        assert all(r["path_length"] == 1 and r["nodes_reached"] == 1 for r in results)
+
+    def test_numba_propagation_kernel_compiles(self):
+        pytest.importorskip("numba")
+        from src.swarmshield.agents import analyzer
+        assert analyzer._numba_kernel_ready()
+        assert analyzer._propagate_trials_nb is not None
+
+    def test_failed_numba_kernel_falls_back_to_numpy(self, monkeypatch, caplog):
+        """A propagation kernel that cannot compile leaves simulate_attack on NumPy."""
+        from src.swarmshield.agents import analyzer
+
+        def broken_njit(**options):
+            def wrap(fn):
+                def kernel(*args):
+                    raise TypeError("cannot type kernel")
+                return kernel
+            return wrap
+
+        monkeypatch.setattr(analyzer, "_NUMBA_AVAILABLE", True)
+        monkeypatch.setattr(analyzer, "njit", broken_njit, raising=False)
+        monkeypatch.setattr(analyzer, "_NUMBA_KERNEL_READY", None)
+        monkeypatch.setattr(analyzer, "_propagate_trials_nb", None)
+        graph = {
+            "nodes": [{"ip": "10.0.0.1", "confidence": 0.9},
+                      {"ip": "10.0.0.2", "confidence": 0.9}],
+            "edges": [{"src": "10.0.0.1", "dst": "10.0.0.2", "weight": 1.5}],
+        }
+        with caplog.at_level("WARNING", logger=analyzer.logger.name):
+            results = AnalyzerAgent().simulate_attack(graph)
+        assert results and all(r["nodes_reached"] == 2 for r in results)
+        assert analyzer._NUMBA_KERNEL_READY is False
+        assert "Numba propagation kernel unavailable" in caplog.text
+
 
 class TestResponderAgent:
     """Tests for ResponderAgent."""
@@ -84,6 +199,21 @@ class TestMahoraga:
         first = list(pop[0])
         assert first == pytest.approx(DEFAULT_GENOME, rel=1e-6)
 
+    def test_create_population_is_reproducible_with_seeded_rng(self):
+        """Mahoraga instances sharing a seed draw the same initial population."""
+        first  = Mahoraga(rng=np.random.default_rng(7)).create_population(size=6)
+        second = Mahoraga(rng=np.random.default_rng(7)).create_population(size=6)
+        assert [list(ind) for ind in first] == [list(ind) for ind in second]
+
+    def test_clamp_genome_keeps_genes_in_bounds(self):
+        """_clamp_genome pulls every gene back inside GENE_BOUNDS in place."""
+        from src.swarmshield.agents.evolver import GENE_BOUNDS, _clamp_genome
+        genome = [-1e9, 1e9, 5.0, -1.0, 1e12, 2.0]
+        _clamp_genome(genome)
+        assert genome[0] == GENE_BOUNDS[0][0]
+        assert genome[1] == GENE_BOUNDS[1][1]
+        assert all(lo <= v <= hi for v, (lo, hi) in zip(genome, GENE_BOUNDS))
+
     def test_evaluate_genome_synthetic(self):
         """evaluate_genome on DEFAULT_GENOME with synthetic scenarios returns a float in [0,1]."""
         from src.swarmshield.agents.evolver import DEFAULT_GENOME, _SYNTHETIC_SCENARIOS
@@ -92,6 +222,45 @@ class TestMahoraga:
         assert isinstance(fit, float)
         assert 0.0 <= fit <= 1.0
 
+    def test_evaluate_genome_reuses_compiled_outcomes(self):
+        """Repeated evaluations against one outcome list compile it only once."""
+        from src.swarmshield.agents.evolver import _SYNTHETIC_SCENARIOS
+        m = Mahoraga()
+        outcomes = list(_SYNTHETIC_SCENARIOS)
+        m.evaluate_genome([1e12] * 5 + [0.5], outcomes)
+        compiled = m._outcomes_cache[2]
+        assert m.evaluate_genome([-1.0] * 5 + [0.5], outcomes) == pytest.approx(8 / 16)
+        assert m._outcomes_cache[2] is compiled
+        outcomes.append({"stats": {"packets_per_second": 1.0}, "was_threat": False})
+        m.evaluate_genome([1e12] * 5 + [0.5], outcomes)
+        assert m._outcomes_cache[2] is not compiled
+
+    def test_batched_scoring_paths_agree_on_certain_outcomes(self):
+        """Array and loop population scorers give the same exact fitness."""
+        from src.swarmshield.agents.evolver import (
+            _SYNTHETIC_SCENARIOS, _compile_outcomes,
+            _score_population_arrays, _score_population_loop,
+        )
+        metrics, labels = _compile_outcomes(list(_SYNTHETIC_SCENARIOS))
+        genomes = np.array([
+            [1e12] * 5 + [0.5],     # nothing ever fires: 4 TN, 8 FN
+            [-1.0] * 5 + [0.5],     # everything fires:   8 TP, 4 FP
+        ])
+        expected = [4 / (4 + 8 + 1e-9), 8 / (8 + 2 * 4 + 1e-9)]
+        assert _score_population_arrays(genomes, metrics, labels, 50).tolist() == expected
+        out = np.empty(2)
+        _score_population_loop(genomes, metrics, labels, 50, out)
+        assert out.tolist() == expected
+
+    def test_pooled_scorer_keeps_population_order(self):
+        """Chunked scoring through an executor returns fitness in input order."""
+        from concurrent.futures import ThreadPoolExecutor
+        from src.swarmshield.agents.evolver import _SYNTHETIC_SCENARIOS, _OutcomeScorer
+        genomes = [[1e12] * 5 + [0.5], [-1.0] * 5 + [0.5]] * 3
+        with ThreadPoolExecutor(2) as pool:
+            fits = _OutcomeScorer(list(_SYNTHETIC_SCENARIOS), pool, 2).score(genomes)
+        assert [f for (f,) in fits] == [4 / (4 + 8 + 1e-9), 8 / (8 + 2 * 4 + 1e-9)] * 3
+
     def test_record_outcome_creates_file(self, tmp_path):
         """record_outcome writes a JSONL entry to outcomes_file."""
         import json
@@ -154,6 +323,102 @@ class TestMahoraga:
         result = m.evolve()
         assert 0.0 <= result["best_fitness"] <= 1.0
 
+    def test_evolve_scores_whole_generations(self, tmp_path, monkeypatch):
+        """evolve() hands the scorer whole batches, never one genome at a time."""
+        from src.swarmshield.agents import evolver
+        batches = []
+        real_score = evolver._OutcomeScorer.score
+
+        def spy(self, population):
+            batches.append(len(population))
+            return real_score(self, population)
+
+        def single(self, genome):
+            raise AssertionError("per-genome evaluation bypassed the batch scorer")
+
+        monkeypatch.setattr(evolver._OutcomeScorer, "score", spy)
+        monkeypatch.setattr(evolver._OutcomeScorer, "__call__", single)
+        m = Mahoraga(
+            outcomes_file=str(tmp_path / "outcomes.jsonl"),
+            best_genome_file=str(tmp_path / "best.json"),
+            pop_size=8,
+            n_generations=3,
+        )
+        m.evolve()
+        # Seed population, eaSimple's (empty) re-check of it, one per generation
+        assert batches[0] == 8
+        assert batches[1] == 0
+        assert len(batches) == 5
+        assert all(0 <= size <= 8 for size in batches)
+
+    def test_eval_workers_submit_to_pool(self, tmp_path, monkeypatch):
+        """eval_workers > 1 scores generations through the executor."""
+        from concurrent.futures import ThreadPoolExecutor
+        from src.swarmshield.agents import evolver
+        chunks = []
+
+        class RecordingPool(ThreadPoolExecutor):
+            def map(self, fn, *iterables, **kwargs):
+                batches = list(iterables[0])
+                chunks.extend(len(b) for b in batches)
+                return super().map(fn, batches, *iterables[1:], **kwargs)
+
+        monkeypatch.setattr(evolver, "ProcessPoolExecutor", RecordingPool)
+        monkeypatch.setattr(evolver, "_NUMBA_KERNEL_READY", False)
+        m = Mahoraga(
+            outcomes_file=str(tmp_path / "outcomes.jsonl"),
+            best_genome_file=str(tmp_path / "best.json"),
+            pop_size=8,
+            n_generations=2,
+            eval_workers=2,
+        )
+        assert 0.0 <= m.evolve()["best_fitness"] <= 1.0
+        assert chunks[:2] == [4, 4]
+
+    def test_eval_workers_env_is_parsed_defensively(self, monkeypatch):
+        """A malformed or non-positive MAHORAGA_EVAL_WORKERS falls back to 1."""
+        from src.swarmshield.agents.evolver import _eval_workers
+        for raw, expected in (("", 1), ("abc", 1), ("0", 1), ("-3", 1), ("4", 4)):
+            monkeypatch.setenv("MAHORAGA_EVAL_WORKERS", raw)
+            assert _eval_workers() == expected
+
+    def test_numba_fitness_kernel_matches_exact_outcomes(self):
+        """The compiled kernel reproduces the deterministic extreme-genome fitness."""
+        pytest.importorskip("numba")
+        from src.swarmshield.agents import evolver
+        assert evolver._numba_kernel_ready()
+        metrics, labels = evolver._compile_outcomes(list(evolver._SYNTHETIC_SCENARIOS))
+        genomes = np.array([[1e12] * 5 + [0.5], [-1.0] * 5 + [0.5]])
+        out = np.empty(2)
+        evolver._score_population_nb(genomes, metrics, labels, 50, out)
+        assert out.tolist() == [4 / (4 + 8 + 1e-9), 8 / (8 + 2 * 4 + 1e-9)]
+
+    def test_failed_numba_kernel_falls_back_to_numpy(self, monkeypatch):
+        """A kernel that cannot compile leaves scoring on the NumPy path."""
+        from src.swarmshield.agents import evolver
+
+        def broken(*args):
+            raise TypeError("cannot type kernel")
+
+        monkeypatch.setattr(evolver, "_NUMBA_AVAILABLE", True)
+        monkeypatch.setattr(evolver, "_score_population_nb", broken, raising=False)
+        monkeypatch.setattr(evolver, "_NUMBA_KERNEL_READY", None)
+        metrics, labels = evolver._compile_outcomes(list(evolver._SYNTHETIC_SCENARIOS))
+        assert evolver._score_population([[-1.0] * 5 + [0.5]], metrics, labels) == [
+            (8 / (8 + 2 * 4 + 1e-9),)
+        ]
+        assert evolver._NUMBA_KERNEL_READY is False
+
+    def test_score_empty_population(self):
+        """An empty batch scores to an empty result instead of dividing by zero."""
+        from src.swarmshield.agents.evolver import (
+            _SYNTHETIC_SCENARIOS, _compile_outcomes, _score_population,
+            _score_population_arrays,
+        )
+        metrics, labels = _compile_outcomes(list(_SYNTHETIC_SCENARIOS))
+        assert _score_population_arrays(np.empty((0, 6)), metrics, labels).shape == (0,)
+        assert _score_population([], metrics, labels) == []
+
     def test_apply_to_agents_no_strategy(self, tmp_path):
         """apply_to_agents returns False when no best strategy saved yet."""
         m = Mahoraga(best_genome_file=str(tmp_path / "best.json"))
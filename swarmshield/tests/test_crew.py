@@ -115,12 +115,14 @@ class TestCrewKickoff(unittest.TestCase):
         c.tasks = [MagicMock() for _ in range(4)]
         return c
 
-    def test_run_demo_calls_kickoff_once(self):
+    def test_run_methods_kickoff_once_per_iteration(self):
         from swarmshield.crew import SwarmShieldCrew
-        mc = self._mock_crew()
-        with patch.object(SwarmShieldCrew, "build", return_value=mc):
-            SwarmShieldCrew().run_demo(iterations=1)
-        mc.kickoff.assert_called_once()
+        for method, iterations in (("run_demo", 1), ("run_batch", 3)):
+            with self.subTest(method=method):
+                mc = self._mock_crew()
+                with patch.object(SwarmShieldCrew, "build", return_value=mc):
+                    getattr(SwarmShieldCrew(), method)(iterations=iterations)
+                self.assertEqual(mc.kickoff.call_count, iterations)
 
     def test_run_demo_passes_traffic_input(self):
         from swarmshield.crew import SwarmShieldCrew
@@ -131,13 +133,6 @@ class TestCrewKickoff(unittest.TestCase):
         inputs = call_args[1].get("inputs") or (call_args[0][0] if call_args[0] else {})
         self.assertIn("traffic_input", inputs)
 
-    def test_run_batch_loops(self):
-        from swarmshield.crew import SwarmShieldCrew
-        mc = self._mock_crew()
-        with patch.object(SwarmShieldCrew, "build", return_value=mc):
-            SwarmShieldCrew().run_batch(iterations=3)
-        self.assertEqual(mc.kickoff.call_count, 3)
-
     def test_run_demo_survives_kickoff_exception(self):
         from swarmshield.crew import SwarmShieldCrew
         mc = self._mock_crew()
@@ -0,0 +1,224 @@
+"""
+test_honeypot_bridge.py — SwarmShield
+
+Unit tests for the honeypot bridge: the slotted event record, batched
+persistence, the column view and the aiohttp front-end.
+
+Run with:
+    python -m pytest tests/test_honeypot_bridge.py
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.swarmshield.agents import honeypot_bridge as hb
+from src.swarmshield.agents.honeypot_bridge import HoneypotEvent
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def bridge(tmp_path, monkeypatch):
+    """
+    Isolate the bridge's module state for one test.
+
+    Events go to a temp JSONL log, nothing is handed to Mahoraga, and no
+    flusher thread is started — tests flush explicitly.
+    """
+    log_file = tmp_path / "honeypot_events.jsonl"
+    monkeypatch.setattr(hb, "HP_LOG_FILE", str(log_file))
+    monkeypatch.setattr(hb, "_uring_disabled", True)
+    monkeypatch.setattr(hb, "_ensure_persist_worker", lambda: None)
+    monkeypatch.setattr(hb, "_enqueue_for_mahoraga", lambda event: None)
+    hb._event_buffer.clear()
+    hb._persist_q.clear()
+    yield log_file
+    hb._event_buffer.clear()
+    hb._persist_q.clear()
+
+
+def _payload(i: int = 1, **overrides):
+    data = {
+        "source_ip":    f"203.0.113.{i}",
+        "attack_type":  "DDoS",
+        "confidence":   0.95,
+        "action_taken": "redirect_to_honeypot",
+        "stats":        {"packets_per_second": 1200, "syn_count": 800},
+    }
+    data.update(overrides)
+    return data
+
+
+# ===========================================================================
+# HoneypotEvent
+# ===========================================================================
+
+class TestHoneypotEvent:
+    """Tests for the slotted HoneypotEvent record."""
+
+    def test_payload_round_trip_keeps_extra_fields(self):
+        """to_dict() reproduces the payload, unknown keys included, plus bridge metadata."""
+        data  = _payload(session_id="abc123", tags=["ssh", "bruteforce"])
+        event = HoneypotEvent.from_payload(data, "2026-01-01T00:00:00.000000+00:00", "bridge-x")
+        assert event.extra == {"session_id": "abc123", "tags": ["ssh", "bruteforce"]}
+        assert event.to_dict() == {
+            **data,
+            "received_at": "2026-01-01T00:00:00.000000+00:00",
+            "bridge_id":   "bridge-x",
+        }
+
+    def test_explicit_null_known_field_is_preserved(self):
+        """A known field sent as null is echoed back rather than dropped."""
+        data  = {"source_ip": "203.0.113.9", "confidence": None}
+        event = HoneypotEvent.from_payload(data, "t", "b")
+        assert event.confidence is None
+        assert event.to_dict() == {
+            "source_ip": "203.0.113.9", "confidence": None,
+            "received_at": "t", "bridge_id": "b",
+        }
+
+    def test_payload_cannot_override_bridge_metadata(self):
+        """received_at / bridge_id always come from the bridge."""
+        data  = _payload(received_at="forged", bridge_id="forged")
+        out   = HoneypotEvent.from_payload(data, "real-ts", "real-id").to_dict()
+        assert (out["received_at"], out["bridge_id"]) == ("real-ts", "real-id")
+
+    def test_event_has_no_instance_dict(self):
+        event = HoneypotEvent.from_payload(_payload(), "t", "b")
+        assert not hasattr(event, "__dict__")
+
+
+# ===========================================================================
+# Persistence
+# ===========================================================================
+
+class TestPersistence:
+    """Tests for the batched JSONL persistence."""
+
+    def test_flush_writes_queued_events_in_order(self, bridge):
+        """Ingest only queues; a flush appends every pending event as JSONL."""
+        for i in range(3):
+            hb._ingest_event(_payload(i))
+        assert not bridge.exists()
+        assert hb._flush_persist_queue() == 3
+        lines = [json.loads(line) for line in bridge.read_text().splitlines()]
+        assert [e["source_ip"] for e in lines] == [f"203.0.113.{i}" for i in range(3)]
+        assert hb._flush_persist_queue() == 0
+
+    def test_pending_events_are_flushed_at_exit(self, tmp_path):
+        """Events still queued when the interpreter exits reach the log."""
+        log_file = tmp_path / "exit.jsonl"
+        script = (
+            "from src.swarmshield.agents import honeypot_bridge as hb\n"
+            f"hb.HP_LOG_FILE = {str(log_file)!r}\n"
+            "hb._uring_disabled = True\n"
+            "hb._ensure_persist_worker = lambda: None\n"
+            "hb._enqueue_for_mahoraga = lambda event: None\n"
+            "for i in range(5):\n"
+            "    hb._ingest_event({'source_ip': f'198.51.100.{i}'})\n"
+            "assert len(hb._persist_q) == 5\n"
+        )
+        subprocess.run([sys.executable, "-c", script], cwd=_REPO_ROOT, check=True, timeout=60)
+        lines = log_file.read_text().splitlines()
+        assert [json.loads(line)["source_ip"] for line in lines] == [
+            f"198.51.100.{i}" for i in range(5)
+        ]
+
+    def test_uring_appender_writes_lines(self, tmp_path):
+        """The io_uring appender writes a batch as-is, when the kernel allows it."""
+        if not hb._LIBURING_AVAILABLE:
+            pytest.skip("liburing not installed")
+        path = tmp_path / "uring.jsonl"
+        try:
+            appender = hb._UringAppender(str(path))
+        except Exception as exc:  # noqa: BLE001
+            pytest.skip(f"io_uring unavailable: {exc}")
+        try:
+            assert appender.write_lines([b'{"a":1}\n', b'{"b":2}\n']) == 2
+        finally:
+            appender.close()
+        assert path.read_bytes() == b'{"a":1}\n{"b":2}\n'
+
+
+# ===========================================================================
+# HTTP endpoints
+# ===========================================================================
+
+class TestColumnsView:
+    """Tests for GET /honeypot_events?format=columns."""
+
+    def test_columns_response_shape(self, bridge):
+        client = hb.app.test_client()
+        client.post("/honeypot_event", json=_payload(1))
+        client.post("/honeypot_event", json={"source_ip": "203.0.113.2"})
+        client.post("/honeypot_event", json=_payload(3, attack_type="PortScan", confidence=0.4))
+
+        body = client.get("/honeypot_events?format=columns&limit=2").get_json()
+        assert set(body) == {"event_count", "columns", "bridge_id"}
+        assert body["event_count"] == 2
+        columns = body["columns"]
+        assert set(columns) == {"source_ip", "received_ns", "attack_type", "confidence"}
+        assert columns["source_ip"]   == ["203.0.113.3", "203.0.113.2"]
+        assert columns["attack_type"] == ["PortScan", None]
+        assert columns["confidence"]  == [0.4, None]
+        assert columns["received_ns"][0] >= columns["received_ns"][1] > 0
+
+    def test_columns_match_default_view(self, bridge):
+        """Both views list the same events in the same (newest-first) order."""
+        client = hb.app.test_client()
+        for i in range(4):
+            client.post("/honeypot_event", json=_payload(i))
+        events  = client.get("/honeypot_events").get_json()["events"]
+        columns = client.get("/honeypot_events?format=columns").get_json()["columns"]
+        assert columns["source_ip"] == [e["source_ip"] for e in events]
+
+
+class TestAsyncApp:
+    """The aiohttp front-end serves the same responses as the Flask app."""
+
+    @staticmethod
+    def _strip_times(body):
+        body = json.loads(json.dumps(body))
+        for event in body.get("events", []):
+            event.pop("received_at", None)
+        body.pop("received_at", None)
+        body.get("columns", {}).pop("received_ns", None)
+        return body
+
+    def test_post_and_get_parity_with_flask(self, bridge):
+        pytest.importorskip("aiohttp")
+        from aiohttp.test_utils import TestClient, TestServer
+
+        requests = [
+            ("POST", "/honeypot_event",  _payload(1, session_id="s-1")),
+            ("POST", "/honeypot_event",  {"attack_type": "DDoS"}),
+            ("POST", "/honeypot_event",  _payload(2)),
+            ("GET",  "/honeypot_events?limit=5", None),
+            ("GET",  "/honeypot_events?format=columns", None),
+            ("GET",  "/honeypot_health", None),
+        ]
+
+        flask_client = hb.app.test_client()
+        flask_results = []
+        for method, path, body in requests:
+            resp = flask_client.open(path, method=method, json=body)
+            flask_results.append((resp.status_code, self._strip_times(resp.get_json())))
+
+        hb._event_buffer.clear()
+        hb._persist_q.clear()
+
+        async def run_async():
+            results = []
+            async with TestClient(TestServer(hb.build_async_app())) as client:
+                for method, path, body in requests:
+                    resp = await client.request(method, path, json=body)
+                    results.append((resp.status, self._strip_times(await resp.json())))
+            return results
+
+        assert asyncio.run(run_async()) == flask_results
+        assert flask_results[1][0] == 400
@@ -0,0 +1,126 @@
+"""
+test_ml_classifier.py — SwarmShield
+
+Parity tests for the CIC-ML classifier's inference paths.  Skipped when
+xgboost/joblib or the bundled model file are not available.
+
+Run with:
+    python -m pytest tests/test_ml_classifier.py
+"""
+
+import numpy as np
+import pytest
+
+from src.swarmshield.utils.ml_classifier import (
+    CIC_BLOCK_LABELS,
+    CICClassifier,
+    _build_feature_vector,
+)
+
+
+@pytest.fixture(scope="module")
+def clf():
+    pytest.importorskip("xgboost")
+    pytest.importorskip("joblib")
+    classifier = CICClassifier().ensure_loaded()
+    if not classifier.available:
+        pytest.skip("CIC model not available")
+    return classifier
+
+
+def _reference_features(stats: dict, feature_names: list) -> list:
+    """The original per-name feature mapping (every other column is 0)."""
+    pps    = float(stats.get("packets_per_second", 0.0))
+    bps    = float(stats.get("bytes_per_second",   0.0))
+    syns   = float(stats.get("syn_count",          0))
+    window = float(stats.get("window_seconds",     10))
+    pkts, nbytes = pps * window, bps * window
+    flow_us  = window * 1_000_000
+    pkt_len  = nbytes / max(pkts, 1)
+    iat_us   = flow_us / max(pkts, 1)
+    values = {
+        "Flow Duration": flow_us, "Total Fwd Packets": pkts,
+        "Total Length of Fwd Packets": nbytes, "Fwd Packet Length Max": pkt_len,
+        "Fwd Packet Length Mean": pkt_len, "Flow Bytes/s": bps, "Flow Packets/s": pps,
+        "Flow IAT Mean": iat_us, "Flow IAT Max": flow_us, "Fwd IAT Total": flow_us,
+        "Fwd IAT Mean": iat_us, "Fwd IAT Max": flow_us, "Fwd Header Length": pkts * 20,
+        "Fwd Packets/s": pps, "Max Packet Length": pkt_len, "Packet Length Mean": pkt_len,
+        "SYN Flag Count": syns, "Average Packet Size": pkt_len,
+        "Avg Fwd Segment Size": pkt_len, "Fwd Header Length.1": pkts * 20,
+        "Subflow Fwd Packets": pkts, "Subflow Fwd Bytes": nbytes,
+        "act_data_pkt_fwd": pkts, "Idle Mean": flow_us, "Idle Max": flow_us,
+    }
+    return [values.get(str(f), 0.0) for f in feature_names]
+
+
+def _reference_predict(classifier: CICClassifier, stats: dict):
+    """Original predict(): sklearn predict_proba + LabelEncoder lookup."""
+    vec   = _reference_features(stats, classifier._feature_names)
+    proba = classifier._model.predict_proba(np.array([vec], dtype=float))[0]
+    idx   = int(proba.argmax())
+    label = (
+        str(classifier._encoder.inverse_transform([idx])[0])
+        if classifier._encoder is not None else str(idx)
+    )
+    clean = label.replace("\ufffd", "-")
+    return clean, float(proba[idx]), clean in CIC_BLOCK_LABELS or label in CIC_BLOCK_LABELS
+
+
+def _random_stats(n: int, seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "packets_per_second": float(10 ** rng.uniform(-1, 5)),
+            "bytes_per_second":   float(10 ** rng.uniform(0, 8)),
+            "syn_count":          int(rng.integers(0, 5000)),
+            "unique_dest_ips":    int(rng.integers(1, 200)),
+            "port_entropy":       float(rng.uniform(0, 8)),
+            "window_seconds":     float(rng.choice([1, 5, 10, 30])),
+        }
+        for _ in range(n)
+    ]
+
+
+def test_feature_vector_matches_reference_mapping(clf):
+    for stats in _random_stats(50, seed=1):
+        assert _build_feature_vector(stats, clf._feature_names) == pytest.approx(
+            _reference_features(stats, clf._feature_names), rel=1e-12,
+        )
+
+
+def test_predict_and_predict_batch_match_reference(clf):
+    """predict() and predict_batch() agree with the original inference path."""
+    stats_list = _random_stats(500)
+    expected   = [_reference_predict(clf, s) for s in stats_list]
+    batched    = clf.predict_batch(stats_list)
+    assert len(batched) == len(expected)
+    for stats, want, got_batch in zip(stats_list, expected, batched):
+        for got in (clf.predict(stats), got_batch):
+            assert got[0] == want[0]
+            assert got[1] == pytest.approx(want[1], rel=1e-5)
+            assert got[2] == want[2]
+
+
+def test_predict_batch_empty(clf):
+    assert clf.predict_batch([]) == []
+
+
+def test_failed_numba_kernel_falls_back_to_python(clf, monkeypatch, caplog):
+    """A feature kernel that cannot compile must not disable predictions."""
+    from src.swarmshield.utils import ml_classifier
+
+    def broken(*args):
+        raise TypeError("cannot type kernel")
+
+    monkeypatch.setattr(ml_classifier, "_NUMBA_AVAILABLE", True)
+    monkeypatch.setattr(ml_classifier, "_fill_features_nb", broken, raising=False)
+    monkeypatch.setattr(ml_classifier, "_NUMBA_KERNEL_READY", None)
+    with caplog.at_level("WARNING", logger=ml_classifier.logger.name):
+        fallback = CICClassifier().ensure_loaded()
+    assert "Numba feature kernel unavailable" in caplog.text
+    assert ml_classifier._NUMBA_KERNEL_READY is False
+    for stats in _random_stats(20, seed=2):
+        want = _reference_predict(clf, stats)
+        got  = fallback.predict(stats)
+        assert got[0] == want[0] and got[2] == want[2]
+        assert got[1] == pytest.approx(want[1], rel=1e-5)
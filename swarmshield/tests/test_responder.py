@@ -4,15 +4,19 @@ test_responder.py — SwarmShield
 Unit tests for the Responder agent helper functions and Flask endpoints.
 
 Run with:
-    python -m unittest tests/test_responder.py
+    python -m pytest tests/test_responder.py
+    python -m pytest -n auto tests/test_responder.py   # parallel (pytest-xdist)
 """
 
+import io
 import json
 import os
 import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 # ---------------------------------------------------------------------------
 # Imports under test
 # ---------------------------------------------------------------------------
@@ -20,21 +24,29 @@ from src.swarmshield.tools.response_tool import (
     format_action_log_entry,
     is_valid_ip,
     load_blocked_ips,
+    load_blocked_ips_from_stream,
     remove_blocked_ip,
     save_blocked_ip,
 )
-from src.swarmshield.agents.responder import app
 
 
 # ---------------------------------------------------------------------------
-# Helper
+# Fixtures / helpers
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(autouse=True, scope="module")
+def _patched_responder(responder_mocks):
+    """Keep iptables and coordinator calls patched for every test in this module."""
+    return responder_mocks
+
+
 def _make_temp_file(content: str = "") -> str:
     """Create a named temp file with *content* and return its path."""
     fd, path = tempfile.mkstemp(suffix=".txt")
-    with os.fdopen(fd, "w") as fh:
-        fh.write(content)
+    try:
+        os.write(fd, content.encode())
+    finally:
+        os.close(fd)
     return path
 
 
@@ -42,34 +54,39 @@ def _make_temp_file(content: str = "") -> str:
 # Tests — IP file helpers
 # ===========================================================================
 
-class TestLoadBlockedIps(unittest.TestCase):
-    """Tests for load_blocked_ips()."""
+class TestLoadBlockedIps:
+    """Tests for load_blocked_ips() and load_blocked_ips_from_stream()."""
 
     def test_load_blocked_ips_empty(self):
-        """load_blocked_ips on an empty file returns an empty set."""
-        path = _make_temp_file("")
-        try:
-            result = load_blocked_ips(path)
-            self.assertIsInstance(result, set)
-            self.assertEqual(result, set())
-        finally:
-            os.unlink(path)
+        """An empty journal yields an empty set."""
+        result = load_blocked_ips_from_stream(io.StringIO(""))
+        assert isinstance(result, set)
+        assert result == set()
 
-    def test_load_blocked_ips_nonexistent_file(self):
+    def test_load_blocked_ips_nonexistent_file(self, tmp_path):
         """load_blocked_ips on a missing file returns an empty set."""
-        result = load_blocked_ips("/tmp/__nonexistent_swarmshield__.txt")
-        self.assertEqual(result, set())
+        assert load_blocked_ips(str(tmp_path / "missing.txt")) == set()
 
     def test_load_blocked_ips_with_entries(self):
-        """load_blocked_ips correctly parses existing entries."""
-        path = _make_temp_file("10.0.0.1\n10.0.0.2\n")
-        try:
-            result = load_blocked_ips(path)
-            self.assertIn("10.0.0.1", result)
-            self.assertIn("10.0.0.2", result)
-            self.assertEqual(len(result), 2)
-        finally:
-            os.unlink(path)
+        """Existing entries are parsed, from text or binary streams."""
+        for stream in (io.StringIO("10.0.0.1\n10.0.0.2\n"), io.BytesIO(b"10.0.0.1\n10.0.0.2\n")):
+            assert load_blocked_ips_from_stream(stream) == {"10.0.0.1", "10.0.0.2"}
+
+    def test_load_blocked_ips_sees_external_append(self, tmp_path):
+        """Cached results are refreshed when the file changes on disk."""
+        path = tmp_path / "ips.txt"
+        path.write_text("10.0.0.1\n")
+        assert load_blocked_ips(str(path)) == {"10.0.0.1"}
+        with open(path, "a") as fh:
+            fh.write("10.0.0.2\n")
+        assert load_blocked_ips(str(path)) == {"10.0.0.1", "10.0.0.2"}
+
+    def test_load_blocked_ips_returns_copy(self, tmp_path):
+        """Mutating the returned set does not affect later loads."""
+        path = tmp_path / "ips.txt"
+        path.write_text("10.0.0.1\n")
+        load_blocked_ips(str(path)).add("10.0.0.99")
+        assert load_blocked_ips(str(path)) == {"10.0.0.1"}
 
 
 # ===========================================================================
@@ -111,33 +128,105 @@ class TestSaveAndRemoveBlockedIp(unittest.TestCase):
         finally:
             os.unlink(path)
 
+    def test_remove_appends_tombstone(self):
+        """Removal appends a -IP entry that later loads honour."""
+        path = _make_temp_file("10.0.0.1\n10.0.0.2\n")
+        try:
+            self.assertTrue(remove_blocked_ip("10.0.0.1", filepath=path))
+            with open(path) as fh:
+                self.assertEqual(fh.read().split()[-1], "-10.0.0.1")
+            self.assertEqual(load_blocked_ips(path), {"10.0.0.2"})
+
+            # Re-blocking after a tombstone takes effect again
+            self.assertTrue(save_blocked_ip("10.0.0.1", filepath=path))
+            self.assertEqual(load_blocked_ips(path), {"10.0.0.1", "10.0.0.2"})
+        finally:
+            os.unlink(path)
 
-# ===========================================================================
-# Tests — IP validation
-# ===========================================================================
+    def test_failed_append_leaves_cache_matching_file(self):
+        """A journal write that raises does not change what later loads see."""
+        path = _make_temp_file("10.0.0.1\n10.0.0.2\n")
+        real_open = open
 
-class TestIsValidIp(unittest.TestCase):
-    """Tests for is_valid_ip()."""
+        def failing_open(file, mode="r", *args, **kwargs):
+            if file == path and "a" in mode:
+                raise PermissionError(13, "Permission denied", file)
+            return real_open(file, mode, *args, **kwargs)
+
+        try:
+            self.assertEqual(load_blocked_ips(path), {"10.0.0.1", "10.0.0.2"})
+            with patch("builtins.open", failing_open):
+                with self.assertRaises(PermissionError):
+                    save_blocked_ip("10.0.0.9", filepath=path)
+                with self.assertRaises(PermissionError):
+                    remove_blocked_ip("10.0.0.1", filepath=path)
+            self.assertEqual(load_blocked_ips(path), {"10.0.0.1", "10.0.0.2"})
+
+            # Retries go through once the file is writable again
+            self.assertTrue(save_blocked_ip("10.0.0.9", filepath=path))
+            self.assertTrue(remove_blocked_ip("10.0.0.1", filepath=path))
+            with open(path) as fh:
+                self.assertEqual(fh.read().split(), ["10.0.0.1", "10.0.0.2", "10.0.0.9", "-10.0.0.1"])
+            self.assertEqual(load_blocked_ips(path), {"10.0.0.2", "10.0.0.9"})
+        finally:
+            os.unlink(path)
 
-    def test_is_valid_ip_true(self):
-        """is_valid_ip returns True for a valid IPv4 address."""
-        self.assertTrue(is_valid_ip("192.168.1.1"))
 
-    def test_is_valid_ip_false_out_of_range(self):
-        """is_valid_ip returns False for an out-of-range IPv4 string."""
-        self.assertFalse(is_valid_ip("999.999.999.999"))
+class TestResponderBlocklist:
+    """block_ip / unblock_ip keep blocked_ips.txt deduplicated and compacted."""
+
+    @pytest.fixture
+    def blocked_file(self, tmp_path, monkeypatch):
+        from src.swarmshield.agents import responder
+        path = tmp_path / "blocked_ips.txt"
+        monkeypatch.setattr(responder, "BLOCKED_IPS_FILE", str(path))
+        monkeypatch.setattr(responder, "ACTIONS_LOG_FILE", str(tmp_path / "actions.log"))
+        return path
+
+    def test_block_is_deduplicated_and_unknown_unblock_is_a_noop(self, blocked_file):
+        from src.swarmshield.agents.responder import block_ip, unblock_ip
+        block_ip("10.0.0.1")
+        block_ip("10.0.0.1")
+        unblock_ip("10.0.0.9")
+        assert blocked_file.read_text().split() == ["10.0.0.1"]
+        unblock_ip("10.0.0.1")
+        assert load_blocked_ips(str(blocked_file)) == set()
+
+    def test_repeated_block_cycles_are_compacted(self, blocked_file, monkeypatch):
+        from src.swarmshield.agents.responder import block_ip, unblock_ip
+        from src.swarmshield.tools import response_tool
+        monkeypatch.setattr(response_tool, "_COMPACT_MIN_LINES", 8)
+        block_ip("10.0.0.2")
+        for _ in range(20):
+            block_ip("10.0.0.1")
+            unblock_ip("10.0.0.1")
+        assert len(blocked_file.read_text().split()) <= 8
+        assert load_blocked_ips(str(blocked_file)) == {"10.0.0.2"}
 
-    def test_is_valid_ip_false_not_an_ip(self):
-        """is_valid_ip returns False for a non-IP string."""
-        self.assertFalse(is_valid_ip("not-an-ip"))
 
-    def test_is_valid_ip_false_ipv6(self):
-        """is_valid_ip returns False for an IPv6 address."""
-        self.assertFalse(is_valid_ip("::1"))
+# ===========================================================================
+# Tests — IP validation
+# ===========================================================================
+
+class TestIsValidIp:
+    """Tests for is_valid_ip()."""
 
-    def test_is_valid_ip_false_empty(self):
-        """is_valid_ip returns False for an empty string."""
-        self.assertFalse(is_valid_ip(""))
+    @pytest.mark.parametrize("address,expected", [
+        ("192.168.1.1",     True),
+        ("999.999.999.999", False),     # out of range
+        ("not-an-ip",       False),
+        ("::1",             False),     # IPv6
+        ("",                False),
+        # inet_aton-style shorthand, hex, leading zeros, trailing junk
+        ("1.2",             False),
+        ("1.2.3",           False),
+        ("0x7f.0.0.1",      False),
+        ("01.2.3.4",        False),
+        ("1.2.3.4 junk",    False),
+    ])
+    def test_is_valid_ip(self, address, expected):
+        """is_valid_ip accepts only canonical dotted-quad IPv4 addresses."""
+        assert is_valid_ip(address) is expected
 
 
 # ===========================================================================
@@ -179,148 +268,138 @@ class TestFormatActionLogEntry(unittest.TestCase):
 # Tests — Flask /verdict endpoint
 # ===========================================================================
 
-class TestVerdictEndpoint(unittest.TestCase):
+# id, source_ip, attack type, confidence, SHAP explanation, action, iptables called?
+_VERDICT_SCENARIOS = [
+    ("ddos-block",            "203.0.113.42", "DDoS",       0.97,
+     "High packet rate from single source", "block",                True),
+    ("portscan-redirect",     "198.51.100.7", "PortScan",   0.88,
+     "Sequential port probing detected",    "redirect_to_honeypot", True),
+    ("normal-monitor",        "10.10.10.10",  "Normal",     0.55,
+     "Baseline traffic",                    "monitor",              False),
+    ("ransomware-quarantine", "172.16.0.77",  "Ransomware", 0.91,
+     "Encrypted file patterns detected",    "quarantine",           True),
+]
+
+# Request bodies are static, so encode them once at import
+_VERDICT_PARAMS = [
+    pytest.param(
+        json.dumps({
+            "source_ip":             source_ip,
+            "predicted_attack_type": attack_type,
+            "confidence":            confidence,
+            "shap_explanation":      explanation,
+            "recommended_action":    action,
+            "agent_id":              "analyzer-1",
+        }).encode(),
+        action,
+        expect_iptables,
+        id=case,
+    )
+    for case, source_ip, attack_type, confidence, explanation, action, expect_iptables
+    in _VERDICT_SCENARIOS
+]
+_MISSING_FIELDS_BODY = json.dumps({"source_ip": "1.2.3.4"}).encode()
+
+
+class TestVerdictEndpoint:
     """Integration-style tests for the /verdict Flask endpoint."""
 
-    def setUp(self):
-        """Configure the Flask test client."""
-        app.config["TESTING"] = True
-        self.client = app.test_client()
-
-    # Patch subprocess.run (iptables) and requests.post (coordinator reports)
-    @patch("src.swarmshield.agents.responder.requests.post")
-    @patch("src.swarmshield.agents.responder.subprocess.run")
-    def test_verdict_endpoint_ddos_block(self, mock_subprocess, mock_requests_post):
+    @pytest.mark.parametrize("body,action,expect_iptables", _VERDICT_PARAMS)
+    def test_verdict_endpoint_scenario(
+        self, wsgi_post, responder_mocks, body, action, expect_iptables,
+    ):
         """
-        POST /verdict with DDoS + block triggers iptables (subprocess.run called)
-        and returns HTTP 200 with action_taken='block'.
+        POST /verdict returns HTTP 200 with the expected action_taken, and
+        calls iptables (subprocess.run) only for active countermeasures.
         """
-        mock_subprocess.return_value = MagicMock(returncode=0, stderr="")
-        mock_requests_post.return_value = MagicMock(status_code=200)
-
-        payload = {
-            "source_ip":            "203.0.113.42",
-            "predicted_attack_type": "DDoS",
-            "confidence":            0.97,
-            "shap_explanation":      "High packet rate from single source",
-            "recommended_action":    "block",
-            "agent_id":              "analyzer-1",
-        }
-
-        response = self.client.post(
-            "/verdict",
-            data=json.dumps(payload),
-            content_type="application/json",
-        )
+        mock_subprocess, _ = responder_mocks
+        mock_subprocess.reset_mock()
 
-        self.assertEqual(response.status_code, 200)
+        response = wsgi_post("/verdict", body)
 
-        body = json.loads(response.data)
-        self.assertEqual(body["status"],       "ok")
-        self.assertEqual(body["action_taken"], "block")
-        self.assertTrue(body["success"])
+        assert response.status_code == 200
 
-        # iptables must have been invoked at least once
-        mock_subprocess.assert_called()
+        reply = response.get_json()
+        assert reply["status"] == "ok"
+        assert reply["action_taken"] == action
+        assert reply["success"]
+        assert mock_subprocess.called is expect_iptables
 
-    @patch("src.swarmshield.agents.responder.requests.post")
-    @patch("src.swarmshield.agents.responder.subprocess.run")
-    def test_verdict_endpoint_portscan_redirect(self, mock_subprocess, mock_requests_post):
-        """
-        POST /verdict with PortScan + redirect_to_honeypot triggers iptables DNAT rule.
-        """
-        mock_subprocess.return_value = MagicMock(returncode=0, stderr="")
-        mock_requests_post.return_value = MagicMock(status_code=200)
-
-        payload = {
-            "source_ip":            "198.51.100.7",
-            "predicted_attack_type": "PortScan",
-            "confidence":            0.88,
-            "shap_explanation":      "Sequential port probing detected",
-            "recommended_action":    "redirect_to_honeypot",
-            "agent_id":              "analyzer-1",
-        }
-
-        response = self.client.post(
+    def test_verdict_endpoint_missing_fields(self, client):
+        """POST /verdict with an incomplete payload returns HTTP 400."""
+        response = client.post(
             "/verdict",
-            data=json.dumps(payload),
+            data=_MISSING_FIELDS_BODY,
             content_type="application/json",
         )
-
-        self.assertEqual(response.status_code, 200)
-        body = json.loads(response.data)
-        self.assertEqual(body["action_taken"], "redirect_to_honeypot")
-        mock_subprocess.assert_called()
-
-    @patch("src.swarmshield.agents.responder.requests.post")
-    @patch("src.swarmshield.agents.responder.subprocess.run")
-    def test_verdict_endpoint_monitor(self, mock_subprocess, mock_requests_post):
-        """
-        POST /verdict with Normal + monitor does NOT call subprocess.run.
-        """
-        mock_subprocess.return_value = MagicMock(returncode=0, stderr="")
-        mock_requests_post.return_value = MagicMock(status_code=200)
-
-        payload = {
-            "source_ip":            "10.10.10.10",
-            "predicted_attack_type": "Normal",
-            "confidence":            0.55,
-            "shap_explanation":      "Baseline traffic",
-            "recommended_action":    "monitor",
-            "agent_id":              "analyzer-1",
-        }
-
-        response = self.client.post(
+        assert response.status_code == 400
+        error = response.get_json()["error"]
+        assert "recommended_action" in error
+        assert "source_ip" not in error
+
+    def test_verdict_rejects_oversize(self, client):
+        """POST /verdict with a body over MAX_CONTENT_LENGTH returns HTTP 413."""
+        response = client.post(
             "/verdict",
-            data=json.dumps(payload),
+            data=b"x" * 8192,
             content_type="application/json",
         )
+        assert response.status_code == 413
+        assert "error" in response.get_json()
 
-        self.assertEqual(response.status_code, 200)
-        body = json.loads(response.data)
-        self.assertEqual(body["action_taken"], "monitor")
-        mock_subprocess.assert_not_called()
+    def test_verdict_endpoint_no_json(self, client):
+        """POST /verdict with no JSON body returns HTTP 400."""
+        response = client.post("/verdict", data="not json")
+        assert response.status_code == 400
 
-    def test_verdict_endpoint_missing_fields(self):
-        """POST /verdict with an incomplete payload returns HTTP 400."""
-        response = self.client.post(
-            "/verdict",
-            data=json.dumps({"source_ip": "1.2.3.4"}),
-            content_type="application/json",
-        )
-        self.assertEqual(response.status_code, 400)
 
-    def test_verdict_endpoint_no_json(self):
-        """POST /verdict with no JSON body returns HTTP 400."""
-        response = self.client.post("/verdict", data="not json")
-        self.assertEqual(response.status_code, 400)
+class TestIptablesRestore:
+    """Tests for the persistent iptables-restore path of _run_rule()."""
+
+    def test_rules_share_one_iptables_restore_process(self, monkeypatch):
+        """With RESPONDER_IPTABLES_RESTORE, rules reuse one process and no fork per rule."""
+        from src.swarmshield.agents import responder
+
+        proc = MagicMock()
+        proc.poll.return_value = None
+        monkeypatch.setattr(responder, "IPTABLES_RESTORE", True)
+        monkeypatch.setattr(responder, "_ipt_restore", None)
+        monkeypatch.setattr(responder, "log_action", MagicMock())
+        with patch("src.swarmshield.agents.responder.subprocess.Popen",
+                   return_value=proc) as mock_popen, \
+             patch("src.swarmshield.agents.responder.subprocess.run") as mock_run:
+            assert responder.quarantine_host("203.0.113.9")
+            assert responder.redirect_to_honeypot("203.0.113.9")
+
+        mock_popen.assert_called_once()
+        mock_run.assert_not_called()
+        written = "".join(c.args[0] for c in proc.stdin.write.call_args_list)
+        assert written.count("COMMIT") == 3
+        assert "*filter\n-A FORWARD -s 203.0.113.9 -j DROP\nCOMMIT\n" in written
+        assert "*nat\n-A PREROUTING -s 203.0.113.9 -j DNAT" in written
 
 
 # ===========================================================================
 # Tests — /health endpoint
 # ===========================================================================
 
-class TestHealthEndpoint(unittest.TestCase):
+class TestHealthEndpoint:
     """Tests for the /health liveness probe."""
 
-    def setUp(self):
-        app.config["TESTING"] = True
-        self.client = app.test_client()
-
-    def test_health_returns_200(self):
+    def test_health_returns_200(self, client):
         """GET /health returns HTTP 200."""
-        response = self.client.get("/health")
-        self.assertEqual(response.status_code, 200)
+        response = client.get("/health")
+        assert response.status_code == 200
 
-    def test_health_payload(self):
+    def test_health_payload(self, client):
         """GET /health body contains status=alive and correct agent_id."""
-        response = self.client.get("/health")
-        body = json.loads(response.data)
-        self.assertEqual(body["status"],   "alive")
-        self.assertEqual(body["agent_id"], "responder-1")
+        response = client.get("/health")
+        body = response.get_json()
+        assert body["status"] == "alive"
+        assert body["agent_id"] == "responder-1"
 
 
 # ===========================================================================
 
 if __name__ == "__main__":
-    unittest.main()
+    raise SystemExit(pytest.main([__file__]))
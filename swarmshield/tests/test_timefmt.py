@@ -0,0 +1,51 @@
+"""
+test_timefmt.py — SwarmShield
+
+Unit tests for the shared ISO-8601 timestamp helpers.
+
+Run with:
+    python -m pytest tests/test_timefmt.py
+"""
+
+from datetime import datetime, timezone
+
+from src.swarmshield.utils import timefmt
+from src.swarmshield.utils.timefmt import iso_from_ns, now_iso, now_iso_seconds
+
+
+def test_iso_from_ns_matches_isoformat():
+    """The cached-prefix formatter agrees with datetime.isoformat()."""
+    for ns in (0, 1_700_000_000_123_456_789, 1_700_000_000_999_999_999, 1_700_000_001_000_000_000):
+        expected = datetime.fromtimestamp(ns // 1000 / 1_000_000, timezone.utc).isoformat(
+            timespec="microseconds",
+        )
+        assert iso_from_ns(ns) == expected
+
+
+def test_iso_from_ns_same_second_reuses_prefix():
+    a = iso_from_ns(1_700_000_000_000_001_000)
+    b = iso_from_ns(1_700_000_000_500_000_000)
+    assert a[:19] == b[:19]
+    assert (a[19:], b[19:]) == (".000001+00:00", ".500000+00:00")
+
+
+def test_now_iso_is_parseable_utc():
+    parsed = datetime.fromisoformat(now_iso())
+    assert parsed.tzinfo is not None and parsed.utcoffset().total_seconds() == 0
+
+
+def test_now_iso_seconds_format():
+    """Seconds-resolution ``Z`` stamp, as in the analyzer's risk reports."""
+    stamp = now_iso_seconds()
+    assert len(stamp) == 20 and stamp.endswith("Z")
+    parsed = datetime.strptime(stamp, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 5
+
+
+def test_now_iso_seconds_shares_prefix_cache(monkeypatch):
+    """Both formats come from the same per-second prefix."""
+    ns = 1_700_000_000_250_000_000
+    monkeypatch.setattr(timefmt.time, "time_ns", lambda: ns)
+    assert now_iso() == "2023-11-14T22:13:20.250000+00:00"
+    assert timefmt._iso_second_cache == (ns // 1_000_000_000, "2023-11-14T22:13:20")
+    assert now_iso_seconds() == "2023-11-14T22:13:20Z"
@@ -2,6 +2,8 @@
 Unit tests for tools.
 """
 
+import struct
+
 import pytest
 from src.swarmshield.tools import (
     PatrolTool,
@@ -10,6 +12,20 @@ from src.swarmshield.tools import (
     EvolutionTool,
     PacketCaptureTool
 )
+import numpy as np
+
+from src.swarmshield.tools import packet_capture_tool
+from src.swarmshield.tools.packet_capture_tool import (
+    _HDR_BYTES,
+    _PacketColumns,
+    _flow_counts,
+    _flows_to_dicts,
+    _frame_fields,
+    _parse_headers,
+    _parse_headers_loop,
+    _parse_headers_numpy,
+    _pkt_fields,
+)
 
 
 class TestPatrolTool:
@@ -91,3 +107,201 @@ class TestPacketCaptureTool:
         result = tool.execute({})
         assert isinstance(result, dict)
         assert "packets_captured" in result
+
+
+class TestPacketColumns:
+    """Tests for the live-capture packet ring."""
+
+    @staticmethod
+    def _row(ts):
+        return (ts, 0x0A000001, 0x0A000002, 80, 1, 60, 0x02)
+
+    def test_take_returns_rows_oldest_first_and_empties(self):
+        ring = _PacketColumns(4)
+        for ts in (1.0, 2.0, 3.0):
+            ring.append(self._row(ts))
+        assert ring.take()["timestamp"].tolist() == [1.0, 2.0, 3.0]
+        assert len(ring) == 0
+
+    def test_full_ring_drops_new_packets(self):
+        ring = _PacketColumns(2)
+        for ts in (1.0, 2.0, 3.0):
+            ring.append(self._row(ts))
+        assert ring.dropped == 1
+        assert ring.take()["timestamp"].tolist() == [1.0, 2.0]
+        ring.append(self._row(4.0))          # slots are reusable after take()
+        assert ring.take()["timestamp"].tolist() == [4.0]
+
+    def test_take_across_the_wrap_point(self):
+        ring = _PacketColumns(4)
+        for ts in (1.0, 2.0, 3.0):
+            ring.append(self._row(ts))
+        ring.take()
+        for ts in (4.0, 5.0, 6.0):           # slots 3, 0, 1
+            ring.append(self._row(ts))
+        assert ring.take()["timestamp"].tolist() == [4.0, 5.0, 6.0]
+
+    def test_staged_rows_wait_for_publish(self):
+        ring = _PacketColumns(4)
+        ring.stage(self._row(1.0))
+        ring.stage(self._row(2.0))
+        assert len(ring) == 0
+        ring.publish()
+        assert ring.take()["timestamp"].tolist() == [1.0, 2.0]
+        assert ring.published == 2
+
+
+class TestFlowCounts:
+    """Packed-key flow aggregation over drained columns."""
+
+    def test_counts_match_per_packet_tally(self):
+        rng = np.random.default_rng(0)
+        n = 500
+        cols = {
+            "src_ip":   rng.choice([0x0A000001, 0xC0A80105], n).astype(np.uint32),
+            "dst_ip":   rng.choice([0x08080808, 0xFFFFFFFF], n).astype(np.uint32),
+            "dst_port": rng.choice([53, 443, 65535], n).astype(np.uint16),
+            "protocol": rng.choice([1, 2], n).astype(np.uint8),
+        }
+        tally = {}
+        for row in zip(*(cols[k].tolist() for k in
+                         ("src_ip", "dst_ip", "dst_port", "protocol"))):
+            tally[row] = tally.get(row, 0) + 1
+        flows = _flows_to_dicts(*_flow_counts(cols))
+        assert sum(f["packets"] for f in flows) == n
+        assert len(flows) == len(tally)
+        first = flows[0]
+        assert first["src_ip"] == "10.0.0.1"
+        assert first["protocol"] in ("TCP", "UDP")
+        names = {"10.0.0.1": 0x0A000001, "192.168.1.5": 0xC0A80105,
+                 "8.8.8.8": 0x08080808, "255.255.255.255": 0xFFFFFFFF}
+        for f in flows:
+            key = (names[f["src_ip"]], names[f["dst_ip"]], f["dst_port"],
+                   ("OTHER", "TCP", "UDP", "ICMP").index(f["protocol"]))
+            assert tally[key] == f["packets"]
+
+
+class TestFrameFields:
+    """The raw-socket header parser must agree with the Scapy path."""
+
+    def test_matches_scapy_dissection(self):
+        scapy = pytest.importorskip("scapy.all")
+        frames = [
+            scapy.Ether() / scapy.IP(src="10.0.0.1", dst="10.0.0.2")
+            / scapy.TCP(dport=80, flags="S") / scapy.Raw(b"x" * 10),
+            scapy.Ether() / scapy.IP(src="10.0.0.5", dst="8.8.8.8")
+            / scapy.UDP(dport=53),
+            scapy.Ether() / scapy.IP(dst="1.1.1.1") / scapy.ICMP(type=3)
+            / scapy.IP(src="1.1.1.1") / scapy.TCP(dport=22),
+            scapy.Ether() / scapy.IP(proto=47) / scapy.Raw(b"gre"),
+            scapy.Ether() / scapy.ARP(),
+        ]
+        for frame in frames:
+            wire = bytes(frame)
+            pkt = scapy.Ether(wire)
+            pkt.time = 1.0
+            assert _frame_fields(wire, len(wire), 1.0) == _pkt_fields(pkt)
+
+        # The batch parser gives the same rows for the IPv4 frames
+        wires = [bytes(frame) for frame in frames]
+        hdr = np.zeros((len(wires), _HDR_BYTES), dtype=np.uint8)
+        for i, wire in enumerate(wires):
+            head = wire[:_HDR_BYTES]
+            hdr[i, :len(head)] = np.frombuffer(head, dtype=np.uint8)
+        lengths = np.array([len(w) for w in wires])
+        cols = _parse_headers(hdr, lengths, lengths, 1.0)
+        batch = list(zip(*(cols[k].tolist() for k in (
+            "timestamp", "src_ip", "dst_ip", "dst_port",
+            "protocol", "size", "tcp_flags",
+        ))))
+        scalar = [_frame_fields(w, len(w), 1.0) for w in wires]
+        assert batch == [row for row in scalar if row is not None]
+
+        # ...and so does the row loop that Numba compiles
+        n = len(wires)
+        out = (np.empty(n, np.uint32), np.empty(n, np.uint32),
+               np.empty(n, np.uint16), np.empty(n, np.uint8),
+               np.empty(n, np.uint8), np.empty(n, np.intp))
+        k = _parse_headers_loop(hdr, lengths, *out)
+        src, dst, dport, proto, flags, keep = (a[:k].tolist() for a in out)
+        loop = [(1.0, s, d, p, c, int(lengths[i]), f)
+                for s, d, p, c, f, i in zip(src, dst, dport, proto, flags, keep)]
+        assert loop == batch
+        assert _rows(_parse_headers_numpy(hdr, lengths, lengths, 1.0)) == batch
+
+
+_COLUMNS = ("timestamp", "src_ip", "dst_ip", "dst_port", "protocol", "size", "tcp_flags")
+
+
+def _rows(cols):
+    return list(zip(*(cols[k].tolist() for k in _COLUMNS)))
+
+
+def _frame(proto: int, l4: bytes = b"", ihl: int = 5, frag: int = 0,
+           ethertype: int = 0x0800) -> bytes:
+    """Ethernet II + IPv4 header (options zero-filled) + *l4* bytes."""
+    ip = struct.pack(
+        ">BBHHHBBH4s4s", 0x40 | ihl, 0, ihl * 4 + len(l4), 1, frag, 64, proto, 0,
+        bytes([10, 0, 0, 1]), bytes([192, 168, 1, 5]),
+    ) + bytes(ihl * 4 - 20)
+    return bytes(12) + struct.pack(">H", ethertype) + ip + l4
+
+
+def _header_batch(frames):
+    hdr = np.zeros((len(frames), _HDR_BYTES), dtype=np.uint8)
+    for i, frame in enumerate(frames):
+        head = frame[:_HDR_BYTES]
+        hdr[i, :len(head)] = np.frombuffer(head, dtype=np.uint8)
+    lengths = np.array([len(f) for f in frames], dtype=np.intp)
+    return hdr, lengths, lengths.astype(np.uint32)
+
+
+class TestParseHeaders:
+    """Both batch header parsers agree with the scalar _frame_fields."""
+
+    FRAMES = [
+        _frame(6, struct.pack(">HHIIBBHHH", 1234, 80, 0, 0, 0x50, 0x12, 0, 0, 0)),
+        _frame(6, struct.pack(">HHIIBBHHH", 1234, 443, 0, 0, 0x50, 0xFF, 0, 0, 0), ihl=7),
+        _frame(17, struct.pack(">HHHH", 5353, 53, 8, 0)),
+        _frame(1, bytes(8)),
+        _frame(1, bytes(4)),                          # truncated ICMP
+        _frame(6, bytes(10)),                         # truncated TCP
+        _frame(6, bytes(20), frag=0x0010),            # non-first fragment
+        _frame(47, b"gre"),
+        _frame(6, bytes(20), ethertype=0x0806),       # not IPv4
+        bytes(20),                                    # runt
+    ]
+
+    def test_numpy_and_loop_match_scalar_parser(self):
+        hdr, captured, wire_len = _header_batch(self.FRAMES)
+        scalar = [_frame_fields(f, len(f), 2.0) for f in self.FRAMES]
+        expected = [row for row in scalar if row is not None]
+        assert len(expected) == 8
+
+        assert _rows(_parse_headers_numpy(hdr, captured, wire_len, 2.0)) == expected
+        assert _rows(_parse_headers(hdr, captured, wire_len, 2.0)) == expected
+
+        n = len(self.FRAMES)
+        out = (np.empty(n, np.uint32), np.empty(n, np.uint32),
+               np.empty(n, np.uint16), np.empty(n, np.uint8),
+               np.empty(n, np.uint8), np.empty(n, np.intp))
+        k = _parse_headers_loop(hdr, captured, *out)
+        src, dst, dport, proto, flags, keep = (a[:k].tolist() for a in out)
+        loop = [(2.0, s, d, p, c, int(wire_len[i]), f)
+                for s, d, p, c, f, i in zip(src, dst, dport, proto, flags, keep)]
+        assert loop == expected
+
+    def test_failed_numba_kernel_falls_back_to_numpy(self, monkeypatch, caplog):
+        """A header kernel that cannot compile leaves parsing on NumPy."""
+        def broken(*args):
+            raise TypeError("cannot type kernel")
+
+        monkeypatch.setattr(packet_capture_tool, "_NUMBA_AVAILABLE", True)
+        monkeypatch.setattr(packet_capture_tool, "_parse_headers_nb", broken, raising=False)
+        monkeypatch.setattr(packet_capture_tool, "_NUMBA_KERNEL_READY", None)
+        hdr, captured, wire_len = _header_batch(self.FRAMES)
+        with caplog.at_level("WARNING", logger=packet_capture_tool.logger.name):
+            cols = _parse_headers(hdr, captured, wire_len, 2.0)
+        assert _rows(cols) == _rows(_parse_headers_numpy(hdr, captured, wire_len, 2.0))
+        assert packet_capture_tool._NUMBA_KERNEL_READY is False
+        assert "Numba header parser unavailable" in caplog.text